@@ -1,7 +1,24 @@
+import os
+import sys
+
 import pytest
 from playwright.sync_api import Browser
 
 from config.config import CONFIG
+from helpers.crawl_checkpoint import CrawlCheckpoint
+from helpers.form_crawler import DEFAULT_CRAWL_PAGES
+from helpers.form_readiness import wait_summary
+from helpers.jira_client import client_stats_summary
+from helpers.link_checker import DEFAULT_LINK_CONCURRENCY, DEFAULT_PER_HOST_LIMIT
+from helpers.logger_helper import StdoutToLogger
+from helpers.migrated_matcher import parse_migrated_dates
+from helpers.payload_template_cache import PayloadTemplateCache
+from helpers.portal_inventory import PortalInventory
+from helpers.portal_snapshot import PortalSnapshot
+from helpers.request_type_inventory import InventoryUnavailable
+from helpers.resource_blocking import BLOCK_PROFILES, ResourceBlocker, blocking_summary
+from helpers.submission_manifest import SubmissionManifest
+from helpers.true_up_results import OUTCOME_RANK, parse_shard, shard_of, summary_lines, write_results_file
 
 
 def pytest_addoption(parser):
@@ -9,8 +26,282 @@ def pytest_addoption(parser):
         "--migrated-date",
         action="store",
         default=None,
-        help="Migration date filter, e.g. '16 Jan 2026'",
+        help="Migration date filter: one date '16 Jan 2026', a list "
+             "'16 Jan 2026, 20 Feb 2026' or a range '16 Jan 2026..18 Jan 2026'",
+    )
+    parser.addoption(
+        "--global-instance",
+        action="append",
+        default=[],
+        help="Instance checked by the global migrated artifact scan "
+             "(repeatable, default: INSTANCE_2)",
+    )
+    parser.addoption(
+        "--full-scan",
+        action="store_true",
+        default=False,
+        help="Download every global object instead of pre-filtering "
+             "names containing 'migrated' on the server",
+    )
+    parser.addoption(
+        "--crawl-pages",
+        action="store",
+        type=int,
+        default=DEFAULT_CRAWL_PAGES,
+        help="Number of pages opened per BrowserContext when crawling forms",
+    )
+    parser.addoption(
+        "--field-cache-ttl",
+        action="store",
+        type=int,
+        default=0,
+        help="Persist the Jira field catalogue to disk and reuse it for this "
+             "many seconds (0 = fetch once per run, keep in memory only)",
+    )
+    parser.addoption(
+        "--submit-concurrency",
+        action="store",
+        type=int,
+        default=4,
+        help="Number of request types submitted in parallel by the form "
+             "submission check",
+    )
+    parser.addoption(
+        "--no-payload-cache",
+        action="store_true",
+        default=False,
+        help="Always discover the request type fields and rebuild the payload "
+             "instead of submitting the cached template directly",
+    )
+    parser.addoption(
+        "--cleanup",
+        action="store",
+        choices=["none", "delete", "resolve"],
+        default="none",
+        help="Delete or resolve the issues created by the form submission "
+             "check once it has finished",
+    )
+    parser.addoption(
+        "--link-concurrency",
+        action="store",
+        type=int,
+        default=DEFAULT_LINK_CONCURRENCY,
+        help="Number of request type links checked in parallel",
     )
+    parser.addoption(
+        "--link-per-host",
+        action="store",
+        type=int,
+        default=DEFAULT_PER_HOST_LIMIT,
+        help="Maximum concurrent link checks against one host",
+    )
+    parser.addoption(
+        "--link-method",
+        action="store",
+        choices=["head", "get"],
+        default="head",
+        help="head: HEAD first with GET fallback, get: always GET",
+    )
+    parser.addoption(
+        "--inventory-ttl",
+        action="store",
+        type=int,
+        default=0,
+        help="Persist each portal's request type list to disk and reuse it "
+             "for this many seconds (0 = scrape once per run, memory only)",
+    )
+    parser.addoption(
+        "--refresh",
+        action="store_true",
+        default=False,
+        help="Ignore the on-disk portal inventory and scrape the portals again",
+    )
+    parser.addoption(
+        "--block-profile",
+        action="store",
+        choices=sorted(BLOCK_PROFILES),
+        default="none",
+        help="Request interception profile for the browser contexts: "
+             "'scrape' aborts images, fonts, media, analytics and third-party "
+             "hosts while keeping the ProForma/servicedesk XHRs",
+    )
+    parser.addoption(
+        "--shard",
+        action="store",
+        default=None,
+        help="Only run this node's slice 'i/k' of the request types, "
+             "workflows and remaining tests (stable hash, same split on every node)",
+    )
+    parser.addoption(
+        "--results-dir",
+        action="store",
+        default=None,
+        help="Write the true-up results of this run to a JSON file in this "
+             "directory (combine the shards with 'post_true_up_process.py merge')",
+    )
+    parser.addoption(
+        "--run-id",
+        action="store",
+        default=None,
+        help="Checkpoint ID of this crawl (default: a new unique ID); every "
+             "extracted form is appended to .cache/crawl_checkpoints/<run id>",
+    )
+    parser.addoption(
+        "--resume",
+        action="store_true",
+        default=False,
+        help="Skip the forms already extracted by --run-id (or by the most "
+             "recent checkpoint of the last 24h when no --run-id is given)",
+    )
+    parser.addoption(
+        "--workflow-source",
+        action="store",
+        choices=["rest", "ui"],
+        default="rest",
+        help="Collect workflow transitions from the Jira workflows API (rest) "
+             "or by scraping the 'View as text' dialogs (ui)",
+    )
+
+
+# =================================================
+# AGGREGATED TRUE-UP SUMMARY (PER-ITEM RESULTS)
+# =================================================
+# Every item gets these user properties at collection (check = the
+# module's TRUE_UP_CHECK or its name); reports carry them back from
+# pytest-xdist workers, so the summary covers every worker and phase.
+CHECK_PROPERTY = "true_up_check"
+ITEM_PROPERTY = "true_up_item"
+
+
+def per_item_test(item) -> bool:
+    """
+    True for the per-form / per-workflow items of TRUE_UP_CHECK modules.
+    """
+    return hasattr(item.module, "TRUE_UP_CHECK") and hasattr(item, "callspec")
+
+
+def pytest_itemcollected(item):
+    module = getattr(item, "module", None)
+    if module is None:
+        return
+
+    check = getattr(module, "TRUE_UP_CHECK", module.__name__)
+    if per_item_test(item):
+        name = str(next(iter(item.callspec.params.values())))
+    else:
+        name = item.name
+
+    item.user_properties.append((CHECK_PROPERTY, check))
+    item.user_properties.append((ITEM_PROPERTY, name))
+
+
+def pytest_configure(config):
+    shard = config.getoption("--shard")
+    if shard:
+        try:
+            parse_shard(shard)
+        except ValueError as e:
+            raise pytest.UsageError(f"Invalid --shard {shard!r}: {e}")
+
+    migrated_date = config.getoption("--migrated-date")
+    try:
+        parse_migrated_dates(migrated_date)
+    except ValueError as e:
+        raise pytest.UsageError(f"Invalid --migrated-date {migrated_date!r}: {e}")
+
+
+def shard_key(item) -> str:
+    """
+    Per-form / per-workflow items shard by their item name, so one node owns
+    a form for every check and crawls it once; other tests by node id.
+    """
+    if per_item_test(item):
+        return dict(item.user_properties)[ITEM_PROPERTY]
+    return item.nodeid
+
+
+def pytest_collection_modifyitems(config, items):
+    shard = config.getoption("--shard")
+    if not shard:
+        return
+
+    index, total = parse_shard(shard)
+    selected, deselected = [], []
+    for item in items:
+        (selected if shard_of(shard_key(item), total) == index else deselected).append(item)
+
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+def results_file_path(config, results_dir: str) -> str:
+    """
+    One file per shard and module set, so shards (and run_all modules run
+    as separate sessions) never overwrite each other.
+    """
+    shard = config.getoption("--shard") or "1/1"
+    modules = sorted({
+        os.path.splitext(os.path.basename(str(arg).split("::")[0]))[0]
+        for arg in config.args
+    })
+    name = f"shard_{shard.replace('/', '_of_')}_{'+'.join(modules) or 'all'}.json"
+    return os.path.join(results_dir, name)
+
+
+def true_up_results(terminalreporter) -> dict[str, dict[str, str]]:
+    """
+    {check: {item: "passed" | "failed" | "skipped"}} from the test reports.
+    A failure in any phase (setup, call, teardown) marks the item failed.
+    """
+    results = {}
+
+    for reports in terminalreporter.stats.values():
+        for report in reports:
+            props = dict(getattr(report, "user_properties", None) or [])
+            if CHECK_PROPERTY not in props or getattr(report, "when", None) is None:
+                continue
+            if report.when != "call" and report.passed:
+                continue
+
+            items = results.setdefault(props[CHECK_PROPERTY], {})
+            item = props.get(ITEM_PROPERTY, report.nodeid)
+            if OUTCOME_RANK[report.outcome] > OUTCOME_RANK.get(items.get(item), -1):
+                items[item] = report.outcome
+
+    return results
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    results = true_up_results(terminalreporter)
+    if results:
+        terminalreporter.section("true-up summary")
+        for line in summary_lines(results):
+            terminalreporter.write_line(line)
+
+    results_dir = config.getoption("--results-dir")
+    if results_dir and not hasattr(config, "workerinput"):
+        path = results_file_path(config, results_dir)
+        write_results_file(path, config.getoption("--shard"), results)
+        terminalreporter.write_line(f"Results file: {path}")
+
+    lines = wait_summary()
+    if lines:
+        terminalreporter.section("form readiness waits")
+        for line in lines:
+            terminalreporter.write_line(line)
+
+    lines = blocking_summary()
+    if lines:
+        terminalreporter.section("browser request blocking")
+        for line in lines:
+            terminalreporter.write_line(line)
+
+    lines = client_stats_summary()
+    if lines:
+        terminalreporter.section("jira rest usage")
+        for line in lines:
+            terminalreporter.write_line(line)
 
 
 @pytest.fixture
@@ -18,17 +309,160 @@ def migrated_date(request):
     return request.config.getoption("--migrated-date")
 
 
+# Name fragment sent to the Jira search endpoints so only candidate
+# objects are downloaded; the client-side regexes still confirm matches.
+MIGRATED_NAME_QUERY = "migrated"
+
+
+@pytest.fixture
+def migrated_name_query(request):
+    if request.config.getoption("--full-scan"):
+        return None
+    return MIGRATED_NAME_QUERY
+
+
+@pytest.fixture(scope="session")
+def crawl_pages(request):
+    return max(1, request.config.getoption("--crawl-pages"))
+
+
+@pytest.fixture(scope="session")
+def field_cache_ttl(request):
+    return request.config.getoption("--field-cache-ttl")
+
+
+@pytest.fixture(scope="session")
+def submit_concurrency(request):
+    return max(1, request.config.getoption("--submit-concurrency"))
+
+
+@pytest.fixture(scope="session")
+def payload_template_cache(request):
+    if request.config.getoption("--no-payload-cache"):
+        return None
+    return PayloadTemplateCache()
+
+
 @pytest.fixture(scope="session")
-def contexts(browser: Browser):
+def submission_manifest():
+    return SubmissionManifest.for_new_run()
+
+
+@pytest.fixture(scope="session")
+def submission_cleanup(request):
+    return request.config.getoption("--cleanup")
+
+
+@pytest.fixture(scope="session")
+def link_check(request):
+    return {
+        "concurrency": request.config.getoption("--link-concurrency"),
+        "per_host": request.config.getoption("--link-per-host"),
+        "head_first": request.config.getoption("--link-method") == "head",
+    }
+
+
+@pytest.fixture(scope="session")
+def workflow_source(request):
+    return request.config.getoption("--workflow-source")
+
+
+@pytest.fixture(autouse=True)
+def inventory_available(request):
+    """
+    Fails the placeholder item that parametrize_from_inventory() generates
+    when a REST inventory could not be fetched at collection.
+    """
+    callspec = getattr(request.node, "callspec", None)
+    for value in (callspec.params.values() if callspec else ()):
+        if isinstance(value, InventoryUnavailable):
+            pytest.fail(str(value))
+
+
+@pytest.fixture(scope="module", autouse=True)
+def module_logger_output(request):
+    """
+    Routes printed output to the running module's log file. Needed when
+    several modules are collected in one session (run_all --single-session),
+    where each import would otherwise redirect stdout to the last logger.
+    Module-scoped autouse so it is set up before, and torn down after, the
+    module's own fixtures (their setup and teardown prints are logged too).
+    """
+    logger = getattr(request.module, "logger", None)
+    if logger is None:
+        yield
+        return
+
+    stdout, stderr = sys.stdout, sys.stderr
+    sys.stdout = StdoutToLogger(logger)
+    sys.stderr = StdoutToLogger(logger)
+    try:
+        yield
+    finally:
+        sys.stdout, sys.stderr = stdout, stderr
+
+
+@pytest.fixture(scope="session")
+def contexts(browser: Browser, request):
     contexts = {}
+    block_profile = request.config.getoption("--block-profile")
 
     for instance_key, cfg in CONFIG.items():
         context = browser.new_context(
             storage_state=cfg["storage_state"]
         )
+        ResourceBlocker(instance_key, cfg["base_url"], block_profile).install(context)
         contexts[instance_key] = context
 
     yield contexts
 
     for context in contexts.values():
         context.close()
+
+
+@pytest.fixture(scope="session")
+def portal_inventory(request, contexts):
+    return PortalInventory(
+        contexts,
+        ttl=request.config.getoption("--inventory-ttl"),
+        refresh=request.config.getoption("--refresh"),
+    )
+
+
+@pytest.fixture(scope="session")
+def selected_items(request) -> set[str] | None:
+    """
+    Names of the per-form / per-workflow items left after --shard, -k or -m
+    deselection, so prefetching never crawls or submits another slice. An
+    empty set means nothing to prefetch; None (no selection options) means
+    every form.
+    """
+    config = request.config
+    if not (config.getoption("--shard") or config.getoption("keyword") or config.getoption("markexpr")):
+        return None
+
+    return {
+        dict(item.user_properties)[ITEM_PROPERTY]
+        for item in request.session.items
+        if per_item_test(item)
+    }
+
+
+@pytest.fixture(scope="session")
+def crawl_checkpoint(request):
+    return CrawlCheckpoint.for_run(
+        request.config.getoption("--run-id"),
+        resume=request.config.getoption("--resume"),
+    )
+
+
+@pytest.fixture(scope="session")
+def portal_snapshot(contexts, portal_inventory, crawl_pages, selected_items, crawl_checkpoint, request):
+    return PortalSnapshot(
+        contexts,
+        portal_inventory,
+        pages=crawl_pages,
+        only=selected_items,
+        checkpoint=crawl_checkpoint,
+        resume=request.config.getoption("--resume"),
+    )
@@ -1,9 +1,7 @@
-from urllib.parse import urljoin
-from playwright.sync_api import Page
 import pytest
-from helpers.collect_request_type_links import collect_request_links
 from config.config import CONFIG
 from helpers.logger_helper import get_logger
+from helpers.request_type_inventory import parametrize_from_inventory, request_type_names
 
 logger = get_logger(
     name="display_name_logger",
@@ -11,106 +9,8 @@ logger = get_logger(
     filename_prefix="display_name_validation",
 )
 
-
-# =========================================================
-# COLLECT FORM FIELDS (UNCHANGED)
-# =========================================================
-def collect_form_fields(page: Page) -> dict[str, dict]:
-    fields = {}
-    page.wait_for_timeout(2000)
-
-    labels = page.locator(
-        "label, "
-        "span[data-testid*='label'], "
-        "div[data-testid*='label'], "
-        "div[aria-label]"
-    ).all()
-
-    for label in labels:
-        raw_text = label.inner_text().strip()
-
-        if not raw_text:
-            continue
-        if len(raw_text) > 60:
-            continue
-        if raw_text.lower() in {
-            "select...",
-            "normal text",
-            "add attachment",
-            "drop files here",
-        }:
-            continue
-
-        name = raw_text.split("\n")[0].replace("*", "").strip()
-        if not name:
-            continue
-
-        required = "*" in raw_text
-
-        box_label = label.bounding_box()
-        if not box_label:
-            continue
-
-        label_for = label.get_attribute("for")
-
-        # RICH TEXT DETECTION (Description + Jira Forms custom fields)
-        if (
-            label_for == "description"
-            or (
-                label_for
-                and label_for.startswith("customfield_")
-                and label.locator(
-                    "xpath=following::div[@contenteditable='true'][1]"
-                ).count() > 0
-            )
-        ):
-            fields[name] = {
-                "required": required,
-                "type": "richtext",
-            }
-            continue
-
-        control = label.locator(
-            "xpath=following::input[1] | "
-            "following::textarea[1] | "
-            "following::*[@role='combobox'][1]"
-        )
-
-        if control.count() == 0:
-            continue
-
-        box_control = control.first.bounding_box()
-        if not box_control:
-            continue
-        if box_control["y"] - box_label["y"] > 200:
-            continue
-
-        tag = control.first.evaluate("el => el.tagName")
-        role = control.first.get_attribute("role")
-
-        if tag == "TEXTAREA":
-            field_type = "textarea"
-        elif role == "combobox":
-            field_type = "dropdown"
-        else:
-            field_type = "text"
-
-        fields[name] = {
-            "required": required,
-            "type": field_type,
-        }
-
-    attachment_heading = page.locator(
-        "span:has-text('Attachment'), div:has-text('Attachment')"
-    )
-
-    if attachment_heading.count() > 0:
-        fields["Attachment"] = {
-            "required": False,
-            "type": "attachment",
-        }
-
-    return fields
+# Name of this check in the aggregated true-up summary (see conftest)
+TRUE_UP_CHECK = "display name fields"
 
 
 # =========================================================
@@ -175,54 +75,43 @@ def compare_and_print_fields(form_name, left_name, right_name, left, right) -> b
 
 
 # =========================================================
-# TEST CASE (FAILS IF ANY FORM FAILS)
+# ONE TEST ITEM PER REQUEST TYPE (XDIST CAN DISTRIBUTE THEM)
 # =========================================================
-def test_field_validation(contexts):
-    print("\n================ FIELD COMPARISON =================\n")
-
-    fields_by_instance = {}
+def pytest_generate_tests(metafunc):
+    if "form" in metafunc.fixturenames:
+        # Forms are compared from the first instance's point of view
+        parametrize_from_inventory(metafunc, "form", lambda: request_type_names(next(iter(CONFIG))))
 
-    # -------- DISCOVERY --------
-    for instance_key, context in contexts.items():
-        cfg = CONFIG[instance_key]
-        base = cfg["base_url"]
-        portal = cfg["portal"]
 
-        page = context.new_page()
-        page.goto(base + portal, wait_until="domcontentloaded")
-
-        links = collect_request_links(page)
-        assert links, f"No request types found for {instance_key}"
+# =========================================================
+# TEST CASE (ONE FORM)
+# =========================================================
+def test_field_validation(portal_snapshot, form):
+    fields_by_instance = {}
 
-        instance_forms = {}
+    # -------- DISCOVERY (SHARED PORTAL SNAPSHOT) --------
+    for instance_key in CONFIG:
+        try:
+            data = portal_snapshot.form(instance_key, form)
+        except RuntimeError as e:
+            pytest.fail(f"\n❌ Could not collect form '{form}' on {instance_key}: {e}")
 
-        for form_name, href in links.items():
-            page.goto(urljoin(base, href), wait_until="domcontentloaded")
-            instance_forms[form_name] = collect_form_fields(page)
+        if data is None:
+            pytest.fail(f"\n❌ Form '{form}' is not listed on the {instance_key} portal")
 
-        page.close()
-        fields_by_instance[instance_key] = instance_forms
+        fields_by_instance[instance_key] = data["fields"]
 
     # -------- COMPARISON --------
     left, right = list(fields_by_instance.keys())
 
-    failed_forms = []
-
-    for form in fields_by_instance[left]:
-        passed = compare_and_print_fields(
-            form_name=form,
-            left_name=left,
-            right_name=right,
-            left=fields_by_instance[left].get(form, {}),
-            right=fields_by_instance[right].get(form, {}),
-        )
-
-        if not passed:
-            failed_forms.append(form)
+    passed = compare_and_print_fields(
+        form_name=form,
+        left_name=left,
+        right_name=right,
+        left=fields_by_instance[left],
+        right=fields_by_instance[right],
+    )
 
     # -------- FINAL ASSERT --------
-    if failed_forms:
-        pytest.fail(
-            f"\n❌ Field comparison failed for {len(failed_forms)} form(s): "
-            f"{', '.join(failed_forms)}"
-        )
+    if not passed:
+        pytest.fail(f"\n❌ Field comparison failed for form: {form}")
@@ -1,8 +1,9 @@
-import re
 import pytest
-import requests
 
-from config.config import CONFIG
+from helpers.field_catalogue import get_field_catalogue
+from helpers.jira_client import get_jira_client
+from helpers.jira_pagination import paginate
+from helpers.migrated_matcher import MigratedMatcher
 from helpers.logger_helper import get_logger
 
 logger = get_logger(
@@ -25,80 +26,52 @@ TYPE_MAP = {
     "user": "User",
 }
 
-# =====================================================
-# REGEX
-# =====================================================
-DESCRIPTION_DATE_REGEX = re.compile(
-    r"Migrated on 16 Jan 2026", re.IGNORECASE
-)
-
-NAME_MIGRATED_REGEX = re.compile(
-    r"\(migrated(?:\s*\d+)?\)", re.IGNORECASE
-)
-
-
 # =====================================================
 # TEST
 # =====================================================
 @pytest.mark.parametrize("instance_key", ["INSTANCE_2"])
-def test_global_custom_jira_field_validation_rest_only(instance_key):
-    cfg = CONFIG[instance_key]
-
-    base_url = cfg["base_url"]
-    auth = (cfg["email"], cfg["api_token"])
+def test_global_custom_jira_field_validation_rest_only(instance_key, migrated_date, migrated_name_query):
+    client = get_jira_client(instance_key)
+    matcher = MigratedMatcher(migrated_date)
+    catalogue = get_field_catalogue(instance_key)
 
     offending = []
-    start_at = 0
-    max_results = 50
+
+    params = {"type": "custom"}
+    if migrated_name_query:
+        params["query"] = migrated_name_query
 
     # =====================================================
-    # FETCH ALL CUSTOM FIELDS (PAGINATED)
+    # FETCH CUSTOM FIELDS (PAGINATED, STREAMED,
+    # PRE-FILTERED ON THE SERVER BY NAME)
     # =====================================================
-    while True:
-        resp = requests.get(
-            f"{base_url}/rest/api/3/field/search",
-            auth=auth,
-            params={
-                "startAt": start_at,
-                "maxResults": max_results,
-                "type": "custom",
-            },
-            timeout=30,
-        )
-        resp.raise_for_status()
-
-        data = resp.json()
-        values = data.get("values", [])
-
-        if not values:
-            break
-
-        for field in values:
-            name = field.get("name", "")
-            description = field.get("description") or ""
-            field_id = field.get("id", "")
-            schema_type = field.get("schema", {}).get("type", "unknown")
-
-            # -------------------------------------------------
-            # STEP 1: DESCRIPTION MUST HAVE MIGRATION DATE
-            # -------------------------------------------------
-            if not DESCRIPTION_DATE_REGEX.search(description):
-                continue
-
-            # -------------------------------------------------
-            # STEP 2: NAME MUST STILL HAVE "(migrated*)"
-            # -------------------------------------------------
-            if NAME_MIGRATED_REGEX.search(name):
-                offending.append({
-                    "Name": name,
-                    "Category": TYPE_MAP.get(schema_type, schema_type),
-                    "Description": description,
-                    "Field ID": field_id,
-                })
-
-        start_at += max_results
-        if start_at >= data.get("total", 0):
-            break
+    for field in paginate(client, "/rest/api/3/field/search", params=params):
+        # Pages already carry id/name/schema: share them with other modules
+        catalogue.remember([field])
+
+        name = field.get("name", "")
+        description = field.get("description") or ""
+        field_id = field.get("id", "")
+        schema_type = field.get("schema", {}).get("type", "unknown")
+
+        # -------------------------------------------------
+        # STEP 1: DESCRIPTION MUST HAVE MIGRATION DATE
+        # -------------------------------------------------
+        bucket = matcher.description_bucket(description)
+        if not bucket:
+            continue
+
+        # -------------------------------------------------
+        # STEP 2: NAME MUST STILL HAVE "(migrated*)"
+        # -------------------------------------------------
+        if matcher.name_tagged(name):
+            offending.append({
+                "Migrated Date": bucket,
+                "Name": name,
+                "Category": TYPE_MAP.get(schema_type, schema_type),
+                "Description": description,
+                "Field ID": field_id,
+            })
 
     # =====================================================
     # OUTPUT
@@ -107,6 +80,7 @@ def test_global_custom_jira_field_validation_rest_only(instance_key):
         print("\n❌ GLOBAL CUSTOM FIELDS STILL HAVING MIGRATED TAG\n")
         for f in offending:
             print(f"- Name       : {f['Name']}")
+            print(f"  Migrated On: {f['Migrated Date']}")
             print(f"  Category   : {f['Category']}")
             print(f"  Description: {f['Description']}")
             print(f"  Field ID   : {f['Field ID']}")
@@ -119,5 +93,5 @@ def test_global_custom_jira_field_validation_rest_only(instance_key):
     # =====================================================
     assert not offending, (
         f"{len(offending)} custom fields still have '(migrated)' in name "
-        f"after migration on 16 Jan 2026"
+        f"after migration on {migrated_date or 'any date'}"
     )
@@ -0,0 +1,44 @@
+from helpers.jira_client import get_jira_client
+from helpers.logger_helper import get_logger
+from helpers.migrated_matcher import MigratedMatcher
+from helpers.migrated_scanner import print_scan_report, scan_instance
+
+logger = get_logger(
+    name="Global_migrated_artifact_logger",
+    log_dir="logs/Global_migrated_artifact_validation_logs",
+    filename_prefix="Global_migrated_artifact_validation",
+)
+
+
+def pytest_generate_tests(metafunc):
+    if "instance_key" in metafunc.fixturenames:
+        metafunc.parametrize(
+            "instance_key",
+            metafunc.config.getoption("--global-instance") or ["INSTANCE_2"],
+        )
+
+
+# =====================================================
+# TEST
+# =====================================================
+def test_global_migrated_artifacts(instance_key, migrated_date, migrated_name_query):
+    report = scan_instance(
+        get_jira_client(instance_key),
+        MigratedMatcher(migrated_date),
+        name_query=migrated_name_query,
+    )
+
+    print_scan_report(instance_key, migrated_date, report)
+
+    offending = sum(len(items) for items in report["offending"].values())
+
+    # =====================================================
+    # ASSERT
+    # =====================================================
+    assert not report["errors"], (
+        f"{len(report['errors'])} object types could not be scanned: "
+        f"{', '.join(sorted(report['errors']))}"
+    )
+    assert not offending, (
+        f"{offending} global objects still contain migrated suffixes"
+    )
@@ -1,9 +1,9 @@
-import re
 import pytest
-import requests
 
-from config.config import CONFIG
+from helpers.jira_client import get_jira_client
+from helpers.jira_pagination import paginate
 from helpers.logger_helper import get_logger
+from helpers.migrated_matcher import MigratedMatcher
 
 logger = get_logger(
     name="Global_status_logger",
@@ -11,72 +11,42 @@ logger = get_logger(
     filename_prefix="Global_status_validation",
 )
 
-# =====================================================
-# REGEX
-# =====================================================
-NAME_MIGRATED_REGEX = re.compile(r"\(migrated(?:\s*\d+)?\)", re.IGNORECASE)
-
-
-def description_matches_date(description: str, migrated_date: str | None) -> bool:
-    """
-    Checks ONLY description for:
-    (Migrated on <DD Mon YYYY> ...)
-    """
-    if not migrated_date:
-        return True
-
-    return re.search(
-        rf"\(migrated\s+on\s+{re.escape(migrated_date)}.*?\)",
-        description,
-        re.IGNORECASE,
-    ) is not None
-
-
 # =====================================================
 # TEST
 # =====================================================
 @pytest.mark.parametrize("instance_key", ["INSTANCE_2"])
-def test_global_status_validation_rest_only(instance_key, migrated_date):
-    cfg = CONFIG[instance_key]
-
-    base_url = cfg["base_url"]
-    auth = (cfg["email"], cfg["api_token"])
+def test_global_status_validation_rest_only(instance_key, migrated_date, migrated_name_query):
+    client = get_jira_client(instance_key)
+    matcher = MigratedMatcher(migrated_date)
 
     offending = []
 
-    # =====================================================
-    # SESSION
-    # =====================================================
-    session = requests.Session()
-    session.auth = auth
-    session.headers.update({
-        "Accept": "application/json",
-        "Content-Type": "application/json",
-    })
+    params = {}
+    if migrated_name_query:
+        params["searchString"] = migrated_name_query
 
     # =====================================================
-    # FETCH STATUSES
+    # FETCH STATUSES (PAGINATED, STREAMED,
+    # PRE-FILTERED ON THE SERVER BY NAME) + VALIDATION
     # =====================================================
-    resp = session.get(f"{base_url}/rest/api/3/status", timeout=30)
-    resp.raise_for_status()
-
-    statuses = resp.json()
-
-    # =====================================================
-    # VALIDATION LOGIC
-    # =====================================================
-    for status in statuses:
+    for status in paginate(client, "/rest/api/3/statuses/search", params=params):
         name = status.get("name", "")
         description = status.get("description", "") or ""
-        category = status.get("statusCategory", {}).get("name", "")
+        category = status.get("statusCategory", "")
+
+        # /statuses/search returns the category key, /status an object
+        if isinstance(category, dict):
+            category = category.get("name", "")
 
-        # 1️⃣ Check migrated DATE in description
-        if not description_matches_date(description, migrated_date):
+        # 1️⃣ Check migrated DATE in description (-> date bucket)
+        bucket = matcher.description_bucket(description)
+        if not bucket:
             continue
 
         # 2️⃣ Check migrated tag in NAME
-        if NAME_MIGRATED_REGEX.search(name):
+        if matcher.name_tagged(name):
             offending.append({
+                "Migrated Date": bucket,
                 "Name": name,
                 "Category": category,
                 "Description": description,
@@ -89,6 +59,7 @@ def test_global_status_validation_rest_only(instance_key, migrated_date):
         print("\nGLOBAL STATUSES WITH MIGRATED TAG IN NAME\n")
         for s in offending:
             print(f"- {s['Name']}")
+            print(f"  Migrated On : {s['Migrated Date']}")
             print(f"  Category    : {s['Category']}")
             print(f"  Description : {s['Description']}")
             print()
@@ -1,8 +1,8 @@
-import re
 import pytest
-import requests
-from config.config import CONFIG
+from helpers.jira_client import get_jira_client
+from helpers.jira_pagination import paginate
 from helpers.logger_helper import get_logger
+from helpers.migrated_matcher import MigratedMatcher
 
 
 logger = get_logger(
@@ -11,61 +11,26 @@ logger = get_logger(
     filename_prefix="Global_workflow_scheme_validation",
 )
 
-# =====================================================
-# REGEX BUILDER (REUSED)
-# =====================================================
-def build_migrated_regex(migrated_date: str | None):
-    if migrated_date:
-        return re.compile(
-            rf"\(migrated\s+on\s+{re.escape(migrated_date)}.*?\)",
-            re.IGNORECASE,
-        )
-    return re.compile(r"\(migrated(?:\s*\d+)?\)", re.IGNORECASE)
-
-
 @pytest.mark.parametrize("instance_key", ["INSTANCE_2"])
 def test_workflow_scheme_validation_rest_only(instance_key, migrated_date):
-    cfg = CONFIG[instance_key]
-
-    base_url = cfg["base_url"]
-    auth = (cfg["email"], cfg["api_token"])
+    client = get_jira_client(instance_key)
 
-    MIGRATED_REGEX = build_migrated_regex(migrated_date)
+    matcher = MigratedMatcher(migrated_date)
 
     offending = []
 
     # =====================================================
-    # SESSION (STABILITY)
-    # =====================================================
-    session = requests.Session()
-    session.auth = auth
-    session.headers.update({
-        "Accept": "application/json",
-        "Content-Type": "application/json",
-    })
-
-    # =====================================================
-    # FETCH ALL WORKFLOW SCHEMES
+    # FETCH ALL WORKFLOW SCHEMES (PAGINATED, STREAMED)
+    # + FIND MIGRATED WORKFLOW SCHEMES
     # =====================================================
-    resp = session.get(
-        f"{base_url}/rest/api/3/workflowscheme",
-        timeout=30,
-    )
-    resp.raise_for_status()
-
-    schemes = resp.json().get("values", [])
-
-    # =====================================================
-    # FIND MIGRATED WORKFLOW SCHEMES
-    # =====================================================
-    for scheme in schemes:
+    for scheme in paginate(client, "/rest/api/3/workflowscheme"):
         name = scheme.get("name", "")
         description = scheme.get("description", "") or ""
 
-        combined = f"{name} {description}"
-
-        if MIGRATED_REGEX.search(combined):
+        bucket = matcher.scheme_bucket(name, description)
+        if bucket:
             offending.append({
+                "Migrated Date": bucket,
                 "Name": name,
                 "Description": description,
             })
@@ -77,6 +42,7 @@ def test_workflow_scheme_validation_rest_only(instance_key, migrated_date):
         print("\nGLOBAL WORKFLOW SCHEMES WITH MIGRATED TAG\n")
         for s in offending:
             print(f"- {s['Name']}")
+            print(f"  Migrated On  : {s['Migrated Date']}")
             print(f"  Description  : {s['Description']}")
             print()
 
@@ -1,10 +1,9 @@
-import re
 import pytest
-import requests
-from datetime import datetime
 
-from config.config import CONFIG
+from helpers.jira_client import get_jira_client
+from helpers.jira_pagination import paginate
 from helpers.logger_helper import get_logger
+from helpers.migrated_matcher import MigratedMatcher
 
 logger = get_logger(
     name="Global_workflow_logger",
@@ -12,94 +11,38 @@ logger = get_logger(
     filename_prefix="Global_workflow_validation",
 )
 
-# =====================================================
-# REGEX
-# =====================================================
-NAME_MIGRATED_REGEX = re.compile(r"\(migrated(?:\s*\d+)?\)", re.IGNORECASE)
-
-
-def description_matches_date(updated: str, migrated_date: str | None) -> bool:
-    """
-    Jira workflow API does NOT return description.
-    We rely on 'updated' timestamp to match CLI date.
-
-    migrated_date format: DD Mon YYYY
-    updated format: YYYY-MM-DD HH:MM:SS.ssssss
-    """
-    if not migrated_date:
-        return True
-
-    try:
-        cli_date = datetime.strptime(migrated_date, "%d %b %Y").date()
-        updated_date = datetime.fromisoformat(updated).date()
-        return cli_date == updated_date
-    except Exception:
-        return False
-
-
 # =====================================================
 # TEST
 # =====================================================
 @pytest.mark.parametrize("instance_key", ["INSTANCE_2"])
-def test_workflow_validation_rest_only(instance_key, migrated_date):
-    cfg = CONFIG[instance_key]
-
-    base_url = cfg["base_url"]
-    auth = (cfg["email"], cfg["api_token"])
+def test_workflow_validation_rest_only(instance_key, migrated_date, migrated_name_query):
+    client = get_jira_client(instance_key)
+    matcher = MigratedMatcher(migrated_date)
 
     offending = []
 
-    # =====================================================
-    # SESSION
-    # =====================================================
-    session = requests.Session()
-    session.auth = auth
-    session.headers.update({
-        "Accept": "application/json",
-        "Content-Type": "application/json",
-    })
-
-    # =====================================================
-    # FETCH WORKFLOWS
-    # =====================================================
-    workflows = []
-    start_at = 0
-    max_results = 50
-
-    while True:
-        resp = session.get(
-            f"{base_url}/rest/api/3/workflows/search",
-            params={"startAt": start_at, "maxResults": max_results},
-            timeout=30,
-        )
-        resp.raise_for_status()
-
-        data = resp.json()
-        values = data.get("values", [])
-
-        if not values:
-            break
-
-        workflows.extend(values)
-        start_at += max_results
-        if start_at >= data.get("total", 0):
-            break
+    params = {}
+    if migrated_name_query:
+        params["queryString"] = migrated_name_query
 
     # =====================================================
-    # VALIDATION LOGIC
+    # FETCH WORKFLOWS (PAGINATED, STREAMED,
+    # PRE-FILTERED ON THE SERVER BY NAME) + VALIDATION
     # =====================================================
-    for wf in workflows:
+    for wf in paginate(client, "/rest/api/3/workflows/search", params=params):
         name = wf.get("name", "")
         updated = wf.get("updated", "")
         active = wf.get("isActive", True)
 
         # 1️⃣ Check migrated DATE first
-        if not description_matches_date(updated, migrated_date):
+        bucket = matcher.updated_bucket(updated)
+        if not bucket:
             continue
 
         # 2️⃣ Then check NAME for migrated tag
-        if NAME_MIGRATED_REGEX.search(name):
+        if matcher.name_tagged(name):
             offending.append({
+                "Migrated Date": bucket,
                 "Name": name,
                 "Active": "Yes" if active else "No",
                 "Last Updated": updated,
@@ -112,6 +55,7 @@ def test_workflow_validation_rest_only(instance_key, migrated_date):
         print("\nGLOBAL WORKFLOWS WITH MIGRATED TAG\n")
         for wf in offending:
             print(f"- {wf['Name']}")
+            print(f"  Migrated On  : {wf['Migrated Date']}")
             print(f"  Active       : {wf['Active']}")
             print(f"  Last Updated : {wf['Last Updated']}")
             print()
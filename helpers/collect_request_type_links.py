@@ -1,17 +1,19 @@
 from playwright.sync_api import Page
 
+REQUEST_TYPE_LINK_SELECTOR = "a[data-test-id^='request-type:']"
+
 
 def collect_request_links(page: Page) -> dict[str, str]:
     links = {}
 
-    page.wait_for_selector("a[data-test-id^='request-type:']", timeout=30000)
-
-    anchors = page.locator("a[data-test-id^='request-type:']").all()
+    page.wait_for_selector(REQUEST_TYPE_LINK_SELECTOR, timeout=30000)
 
-    for a in anchors:
-        test_id = a.get_attribute("data-test-id")
-        href = a.get_attribute("href")
+    # One in-page call returns every (data-test-id, href) pair
+    anchors = page.locator(REQUEST_TYPE_LINK_SELECTOR).evaluate_all(
+        "els => els.map(a => [a.getAttribute('data-test-id'), a.getAttribute('href')])"
+    )
 
+    for test_id, href in anchors:
         if not test_id or not href:
             continue
 
@@ -0,0 +1,146 @@
+import glob
+import json
+import os
+import shutil
+import threading
+import time
+import uuid
+from datetime import datetime
+
+CHECKPOINT_DIR = ".cache/crawl_checkpoints"
+
+# --resume without a run ID only continues a checkpoint this recent
+RESUME_MAX_AGE = 24 * 3600
+# Checkpoints untouched for this long are deleted when a run starts
+CHECKPOINT_RETENTION = 7 * 24 * 3600
+
+
+def _last_write(directory: str) -> float:
+    # Appends do not touch the directory mtime: look at the files too
+    files = glob.glob(os.path.join(directory, "*.jsonl"))
+    return max([os.path.getmtime(directory)] + [os.path.getmtime(f) for f in files])
+
+
+def _jsonable(value):
+    # Extractor data may hold sets (e.g. custom field ids); store them sorted
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    raise TypeError(f"Cannot checkpoint {type(value).__name__}")
+
+
+# =================================================
+# CRAWL CHECKPOINT (APPEND-ONLY JSONL PER RUN)
+# =================================================
+class CrawlCheckpoint:
+    """
+    One JSON line per extracted form, flushed to disk as soon as the form
+    is done, so a crashed crawl can resume with only the remaining forms:
+
+      {"instance": ..., "form": ..., "data": {extractor name: data, ...}}
+
+    Each run ID is a directory under CHECKPOINT_DIR with one file per
+    process (xdist workers and parallel run_all modules never interleave
+    their writes); forms that failed are not recorded and are crawled
+    again on resume.
+    """
+
+    def __init__(self, run_id: str):
+        self.run_id = run_id
+        self.directory = os.path.join(CHECKPOINT_DIR, run_id)
+        worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+        self.path = os.path.join(self.directory, f"{worker}_{os.getpid()}.jsonl")
+        self._lock = threading.Lock()
+        self._repaired = False
+
+    @staticmethod
+    def new_run_id() -> str:
+        """
+        Timestamp plus a random suffix: runs started in the same second
+        (parallel run_all subprocesses) never share a directory.
+        """
+        return f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+
+    @classmethod
+    def for_run(cls, run_id: str | None = None, resume: bool = False) -> "CrawlCheckpoint":
+        """
+        --resume without a run ID continues the most recent checkpoint if it
+        is younger than RESUME_MAX_AGE. A new run ID is shared by all xdist
+        workers of the same session; run_all passes one ID to all modules.
+        """
+        prune_checkpoints()
+
+        if not run_id and resume:
+            latest = cls.latest_run_id()
+            if latest:
+                return cls(latest)
+
+        return cls(
+            run_id
+            or os.environ.get("PYTEST_XDIST_TESTRUNUID")
+            or cls.new_run_id()
+        )
+
+    @staticmethod
+    def latest_run_id(max_age: float = RESUME_MAX_AGE) -> str | None:
+        runs = [d for d in glob.glob(os.path.join(CHECKPOINT_DIR, "*")) if os.path.isdir(d)]
+        if not runs:
+            return None
+
+        latest = max(runs, key=_last_write)
+        if time.time() - _last_write(latest) > max_age:
+            return None
+        return os.path.basename(latest)
+
+    def record(self, instance_key: str, form: str, data: dict):
+        line = json.dumps(
+            {"instance": instance_key, "form": form, "data": data},
+            default=_jsonable,
+        )
+
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            if not self._repaired:
+                # A crash mid-write leaves a torn line: start on a fresh one
+                line = self._terminate_torn_line() + line
+                self._repaired = True
+
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+    def _terminate_torn_line(self) -> str:
+        if not os.path.exists(self.path) or os.path.getsize(self.path) == 0:
+            return ""
+        with open(self.path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            return "" if f.read(1) == b"\n" else "\n"
+
+    def completed(self, instance_key: str) -> dict[str, dict]:
+        """
+        {form: extractor data} already extracted for the instance by any
+        process of this run. A torn last line (crash mid-write) is ignored.
+        """
+        forms = {}
+
+        for path in sorted(glob.glob(os.path.join(self.directory, "*.jsonl"))):
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if record["instance"] == instance_key:
+                        forms[record["form"]] = record["data"]
+
+        return forms
+
+
+def prune_checkpoints(retention: float = CHECKPOINT_RETENTION):
+    """
+    Deletes the checkpoint directories not written to for `retention` seconds.
+    """
+    now = time.time()
+    for path in glob.glob(os.path.join(CHECKPOINT_DIR, "*")):
+        if os.path.isdir(path) and now - _last_write(path) > retention:
+            shutil.rmtree(path, ignore_errors=True)
@@ -0,0 +1,171 @@
+import json
+import os
+import threading
+import time
+
+from helpers.jira_client import get_jira_client
+
+FIELD_CACHE_DIR = ".cache/field_catalogue"
+
+# Below this many unknown IDs, resolve them through /field/search?id=...
+# instead of downloading the whole /field catalogue.
+SMALL_LOOKUP_LIMIT = 50
+
+
+# =================================================
+# FIELD CATALOGUE (ONE PER INSTANCE PER RUN)
+# =================================================
+class FieldCatalogue:
+    """
+    Caches {field id: {"name", "schema"}} for one Jira instance.
+
+    ttl > 0 persists the full catalogue to FIELD_CACHE_DIR and reuses it
+    across runs while it is younger than `ttl` seconds; resolve() then
+    reads the disk copy before any REST lookup.
+    """
+
+    def __init__(self, instance_key: str, ttl: int = 0):
+        self.instance_key = instance_key
+        self.client = get_jira_client(instance_key)
+        self.ttl = ttl
+        self.fields: dict[str, dict] = {}
+        self.not_found: set[str] = set()
+        self.complete = False
+        self._disk_checked = False
+        self._from_disk = False
+        self._lock = threading.Lock()
+
+    # ---------- DISK ----------
+    @property
+    def cache_file(self) -> str:
+        return os.path.join(FIELD_CACHE_DIR, f"{self.instance_key}.json")
+
+    def _load_from_disk(self) -> bool:
+        if self.ttl <= 0 or not os.path.exists(self.cache_file):
+            return False
+
+        # A truncated or hand-edited cache is a miss: fetch again
+        try:
+            with open(self.cache_file, encoding="utf-8") as f:
+                cached = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return False
+
+        if not isinstance(cached, dict) or time.time() - cached.get("fetched_at", 0) > self.ttl:
+            return False
+        if not isinstance(cached.get("fields"), dict):
+            return False
+
+        self.fields.update(cached["fields"])
+        return True
+
+    def _save_to_disk(self):
+        if self.ttl <= 0:
+            return
+
+        # Write-then-rename: a concurrent or interrupted run never reads a partial file
+        os.makedirs(FIELD_CACHE_DIR, exist_ok=True)
+        tmp = f"{self.cache_file}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"fetched_at": time.time(), "fields": self.fields}, f)
+        os.replace(tmp, self.cache_file)
+
+    # ---------- LOADING ----------
+    def remember(self, fields: list[dict]):
+        """
+        Seeds the catalogue from field objects another caller already
+        fetched (e.g. /field/search pages in the global field check).
+        """
+        with self._lock:
+            for f in fields:
+                self.fields[f["id"]] = {
+                    "name": f.get("name", ""),
+                    "schema": f.get("schema", {}),
+                }
+
+    def _use_disk_cache(self) -> bool:
+        """
+        Loads a fresh on-disk catalogue once per run (caller holds the
+        lock); True when the catalogue is complete afterwards.
+        """
+        if not self._disk_checked:
+            self._disk_checked = True
+            if self._load_from_disk():
+                self.complete = True
+                self._from_disk = True
+        return self.complete
+
+    def load(self):
+        with self._lock:
+            if self._use_disk_cache():
+                return
+
+            for f in self.client.get_json("/rest/api/3/field"):
+                self.fields[f["id"]] = {
+                    "name": f.get("name", ""),
+                    "schema": f.get("schema", {}),
+                }
+            self._save_to_disk()
+
+            self.complete = True
+
+    def _lookup(self, field_ids: list[str]):
+        found = []
+        for i in range(0, len(field_ids), SMALL_LOOKUP_LIMIT):
+            chunk = field_ids[i:i + SMALL_LOOKUP_LIMIT]
+            data = self.client.get_json(
+                "/rest/api/3/field/search",
+                params=[("id", fid) for fid in chunk]
+                + [("maxResults", SMALL_LOOKUP_LIMIT)],
+            )
+            found.extend(data.get("values", []))
+
+        self.remember(found)
+        with self._lock:
+            self.not_found.update(set(field_ids) - set(self.fields))
+
+    # ---------- LOOKUPS ----------
+    def resolve(self, field_ids) -> dict[str, str]:
+        unknown = sorted(
+            fid for fid in field_ids
+            if fid not in self.fields and fid not in self.not_found
+        )
+
+        if unknown and not self.complete:
+            with self._lock:
+                complete = self._use_disk_cache()
+
+            # With a TTL the full catalogue is fetched (and saved) instead,
+            # so the next runs resolve every form from disk
+            if complete:
+                pass
+            elif len(unknown) <= SMALL_LOOKUP_LIMIT and self.ttl <= 0:
+                self._lookup(unknown)
+            else:
+                self.load()
+
+        # A catalogue read from disk predates fields created since it was
+        # saved: look those up instead of resolving them to UNKNOWN
+        if unknown and self._from_disk:
+            missing = [
+                fid for fid in unknown
+                if fid not in self.fields and fid not in self.not_found
+            ]
+            if missing:
+                self._lookup(missing)
+
+        return {
+            fid: self.fields.get(fid, {}).get("name", "UNKNOWN")
+            for fid in field_ids
+        }
+
+
+_CATALOGUES: dict[str, FieldCatalogue] = {}
+_CATALOGUES_LOCK = threading.Lock()
+
+
+def get_field_catalogue(instance_key: str, ttl: int = 0) -> FieldCatalogue:
+    with _CATALOGUES_LOCK:
+        if instance_key not in _CATALOGUES:
+            _CATALOGUES[instance_key] = FieldCatalogue(instance_key, ttl=ttl)
+        return _CATALOGUES[instance_key]
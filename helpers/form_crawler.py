@@ -0,0 +1,99 @@
+import time
+from collections import deque
+from typing import Callable
+from urllib.parse import urljoin
+
+from playwright.sync_api import BrowserContext, Page
+
+DEFAULT_CRAWL_PAGES = 4
+
+
+# =================================================
+# CONCURRENT FORM CRAWL (PAGE POOL)
+# =================================================
+def crawl_forms(
+    context: BrowserContext,
+    base: str,
+    links: dict[str, str],
+    extract: Callable[[Page, dict], object],
+    pages: int = DEFAULT_CRAWL_PAGES,
+    on_page_open: Callable[[Page], None] | None = None,
+    before_navigation: Callable[[Page, dict], None] | None = None,
+) -> tuple[dict[str, object], dict[str, str]]:
+    """
+    Visits every form in `links` ({request type name: href}) with a pool of
+    `pages` tabs opened in one BrowserContext and runs `extract(page, visit)`
+    on each.
+
+    `visit` describes the navigation: {"name", "url", "status", "final_url",
+    "latency"} where status/final_url come from the main document response
+    and latency is the time until that response arrived. Optional hooks run once per pooled page (`on_page_open`) and
+    right before each navigation (`before_navigation(page, visit)`).
+
+    The sync Playwright API is single-threaded, so the pool is pipelined:
+    every idle page starts its next navigation immediately and the browser
+    loads those forms in parallel while `extract` runs on the oldest one.
+
+    Returns (results, errors), both keyed by request type name. A failing
+    form is recorded in `errors` and does not stop the crawl.
+    """
+    results = {}
+    errors = {}
+
+    if not links:
+        return results, errors
+
+    pending = deque(links.items())
+    in_flight = deque()
+    pool = [context.new_page() for _ in range(max(1, min(pages, len(pending))))]
+
+    if on_page_open:
+        for page in pool:
+            on_page_open(page)
+
+    def start_next(page: Page):
+        while pending:
+            name, href = pending.popleft()
+            visit = {
+                "name": name,
+                "url": urljoin(base, href),
+                "status": None,
+                "final_url": None,
+                "latency": None,
+            }
+
+            try:
+                if before_navigation:
+                    before_navigation(page, visit)
+                started = time.perf_counter()
+                response = page.goto(visit["url"], wait_until="commit")
+                visit["latency"] = time.perf_counter() - started
+            except Exception as e:
+                errors[name] = f"Navigation failed: {e}"
+                continue
+
+            if response:
+                visit["status"] = response.status
+                visit["final_url"] = response.url
+
+            in_flight.append((page, visit))
+            return
+
+    try:
+        for page in pool:
+            start_next(page)
+
+        while in_flight:
+            page, visit = in_flight.popleft()
+            try:
+                page.wait_for_load_state("domcontentloaded")
+                results[visit["name"]] = extract(page, visit)
+            except Exception as e:
+                errors[visit["name"]] = str(e)
+
+            start_next(page)
+    finally:
+        for page in pool:
+            page.close()
+
+    return results, errors
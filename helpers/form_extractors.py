@@ -0,0 +1,270 @@
+from typing import Callable
+
+from playwright.sync_api import Error as PlaywrightError
+from playwright.sync_api import Page, Request, Response
+
+from helpers.form_readiness import PROFORMA_FIELDDATA_REGEX
+
+# name -> extractor(page, visit); every registered extractor runs on each
+# form page loaded by the portal snapshot crawl (see helpers/portal_snapshot)
+FORM_EXTRACTORS: dict[str, Callable[[Page, dict], object]] = {}
+
+
+def register_extractor(name: str):
+    def decorator(fn):
+        FORM_EXTRACTORS[name] = fn
+        return fn
+    return decorator
+
+
+# =================================================
+# IN-PAGE EXTRACTION (ONE ROUND TRIP PER FORM)
+# =================================================
+LABEL_SELECTOR = (
+    "label, "
+    "span[data-testid*='label'], "
+    "div[data-testid*='label'], "
+    "div[aria-label]"
+)
+
+# Mirrors the Playwright calls the classification rules were written
+# against: inner_text() -> innerText, bounding_box() -> null when the
+# element has no layout box, XPath following:: lookups, tagName and role.
+FORM_FIELDS_SCRIPT = """
+(labelSelector) => {
+    const box = (el) => {
+        if (!el || el.getClientRects().length === 0) return null;
+        const r = el.getBoundingClientRect();
+        return { x: r.x, y: r.y, width: r.width, height: r.height };
+    };
+
+    const firstFollowing = (el, xpath) =>
+        document.evaluate(
+            xpath, el, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+        ).snapshotItem(0);
+
+    const labels = Array.from(document.querySelectorAll(labelSelector)).map((label) => {
+        const labelFor = label.getAttribute("for");
+        const control = firstFollowing(
+            label,
+            "following::input[1] | following::textarea[1] | following::*[@role='combobox'][1]"
+        );
+
+        return {
+            text: (label.innerText || "").trim(),
+            for: labelFor,
+            box: box(label),
+            hasRichText:
+                !!labelFor
+                && labelFor.startsWith("customfield_")
+                && !!firstFollowing(label, "following::div[@contenteditable='true'][1]"),
+            control: control
+                ? { tag: control.tagName, role: control.getAttribute("role"), box: box(control) }
+                : null,
+        };
+    });
+
+    const hasAttachment = Array.from(document.querySelectorAll("span, div")).some(
+        (el) => (el.textContent || "").toLowerCase().includes("attachment")
+    );
+
+    return { labels, hasAttachment };
+}
+"""
+
+
+def classify_form_field(label: dict) -> tuple[str, dict] | None:
+    raw_text = label["text"]
+
+    if not raw_text:
+        return None
+    if len(raw_text) > 60:
+        return None
+    if raw_text.lower() in {
+        "select...",
+        "normal text",
+        "add attachment",
+        "drop files here",
+    }:
+        return None
+
+    name = raw_text.split("\n")[0].replace("*", "").strip()
+    if not name:
+        return None
+
+    required = "*" in raw_text
+
+    box_label = label["box"]
+    if not box_label:
+        return None
+
+    label_for = label["for"]
+
+    # RICH TEXT DETECTION (Description + Jira Forms custom fields)
+    if label_for == "description" or label["hasRichText"]:
+        return name, {
+            "required": required,
+            "type": "richtext",
+        }
+
+    control = label["control"]
+    if not control:
+        return None
+
+    box_control = control["box"]
+    if not box_control:
+        return None
+    if box_control["y"] - box_label["y"] > 200:
+        return None
+
+    if control["tag"] == "TEXTAREA":
+        field_type = "textarea"
+    elif control["role"] == "combobox":
+        field_type = "dropdown"
+    else:
+        field_type = "text"
+
+    return name, {
+        "required": required,
+        "type": field_type,
+    }
+
+
+# =================================================
+# COLLECT FORM FIELDS (LABEL METADATA)
+# =================================================
+def collect_form_fields(page: Page) -> dict[str, dict]:
+    """
+    Expects a ready form: the portal snapshot waits once per page
+    (wait_for_form_ready) before running the extractors.
+    """
+    fields = {}
+
+    extracted = page.evaluate(FORM_FIELDS_SCRIPT, LABEL_SELECTOR)
+
+    for label in extracted["labels"]:
+        classified = classify_form_field(label)
+        if classified:
+            name, meta = classified
+            fields[name] = meta
+
+    if extracted["hasAttachment"]:
+        fields["Attachment"] = {
+            "required": False,
+            "type": "attachment",
+        }
+
+    return fields
+
+
+# =================================================
+# DOM CUSTOM FIELD DISCOVERY
+# =================================================
+DOM_CUSTOM_FIELDS_SCRIPT = """
+labels => labels
+    .map(label => label.getAttribute("for"))
+    .filter(id => id && id.startsWith("customfield_"))
+"""
+
+
+def discover_dom_custom_fields(page: Page) -> set[str]:
+    # One round trip for all labels instead of one get_attribute per label
+    return set(page.locator("label").evaluate_all(DOM_CUSTOM_FIELDS_SCRIPT))
+
+
+# =================================================
+# PROFORMA FIELD CAPTURE
+# =================================================
+class ProformaCapture:
+    """
+    Collects customfield_ keys from ProForma `fielddata` responses into
+    visit["proforma_field_ids"] of the form navigation that caused them.
+
+    The response handler only matches the URL (a local property, no IPC)
+    and parses JSON for fielddata responses alone. A response is attributed
+    to the page's current visit when its request was sent by that form
+    (Referer is the form URL, or absent).
+
+    It also counts the visit's fielddata requests and responses
+    (visit["proforma_requested"/"proforma_received"]), which
+    wait_for_form_ready() uses to wait for the ProForma fields.
+    """
+
+    def __init__(self):
+        self.visits = {}
+
+    @staticmethod
+    def caused_by(request: Request, visit: dict) -> bool:
+        referer = request.headers.get("referer")
+        return not referer or referer.startswith((visit["url"], visit["final_url"] or visit["url"]))
+
+    def attach(self, page: Page):
+        def on_request(request: Request):
+            if not PROFORMA_FIELDDATA_REGEX.search(request.url):
+                return
+
+            visit = self.visits.get(page)
+            if visit and self.caused_by(request, visit):
+                visit["proforma_requested"] += 1
+
+        def on_response(response: Response):
+            if not PROFORMA_FIELDDATA_REGEX.search(response.url):
+                return
+
+            visit = self.visits.get(page)
+            if not visit or not self.caused_by(response.request, visit):
+                return
+
+            try:
+                data = response.json()
+                if isinstance(data, dict):
+                    visit["proforma_field_ids"].update(
+                        key for key in data if key.startswith("customfield_")
+                    )
+            except (ValueError, PlaywrightError):
+                pass
+            finally:
+                # Counted once the ids are stored, so waiters see them
+                visit["proforma_received"] += 1
+
+        def on_request_failed(request: Request):
+            # No response will follow: stop waiting for it
+            if not PROFORMA_FIELDDATA_REGEX.search(request.url):
+                return
+
+            visit = self.visits.get(page)
+            if visit and self.caused_by(request, visit):
+                visit["proforma_received"] += 1
+
+        page.on("request", on_request)
+        page.on("response", on_response)
+        page.on("requestfailed", on_request_failed)
+
+    def begin(self, page: Page, visit: dict):
+        visit["proforma_field_ids"] = set()
+        visit["proforma_requested"] = 0
+        visit["proforma_received"] = 0
+        self.visits[page] = visit
+
+
+# =================================================
+# REGISTERED EXTRACTORS
+# =================================================
+@register_extractor("http_status")
+def extract_http_status(page: Page, visit: dict) -> dict:
+    return {
+        "status": visit["status"],
+        "final_url": visit["final_url"],
+        "latency": visit["latency"],
+    }
+
+
+@register_extractor("fields")
+def extract_fields(page: Page, visit: dict) -> dict[str, dict]:
+    return collect_form_fields(page)
+
+
+@register_extractor("custom_field_ids")
+def extract_custom_field_ids(page: Page, visit: dict) -> list[str]:
+    field_ids = visit.get("proforma_field_ids", set()) | discover_dom_custom_fields(page)
+    return sorted(field_ids)
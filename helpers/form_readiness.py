@@ -0,0 +1,153 @@
+import re
+import time
+
+from playwright.sync_api import Locator, Page
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+DEFAULT_READY_TIMEOUT = 15000
+
+# Customer portal create pages render their fields inside a <form>
+FORM_READY_SELECTOR = "form"
+
+# ProForma forms load their fields with this XHR after the page renders
+PROFORMA_FIELDDATA_REGEX = re.compile(r"/gateway/api/proforma/.*fielddata", re.IGNORECASE)
+PROFORMA_POLL_MS = 50
+
+# The ProForma form mounts inside the portal form and only then sends its
+# fielddata request; this container is the positive signal that one is due.
+PROFORMA_CONTAINER_SELECTOR = (
+    "[data-testid*='proforma'], [class*='proforma'], [id*='proforma'], "
+    "[data-testid*='jira-forms'], [class*='ProForma']"
+)
+# How long a rendered form is given to mount a ProForma container
+PROFORMA_DETECT_TIMEOUT = 2000
+
+# Every wait is recorded here: {"name", "seconds", "ready"}
+WAIT_TIMINGS: list[dict] = []
+
+
+def record_wait(name: str, started: float, ready: bool):
+    WAIT_TIMINGS.append({
+        "name": name,
+        "seconds": time.perf_counter() - started,
+        "ready": ready,
+    })
+
+
+# =================================================
+# BASIC SIGNALS
+# =================================================
+def wait_for_selector_ready(
+    page: Page,
+    selector: str,
+    name: str,
+    timeout: int = DEFAULT_READY_TIMEOUT,
+    state: str = "visible",
+) -> bool:
+    started = time.perf_counter()
+    try:
+        page.wait_for_selector(selector, state=state, timeout=timeout)
+        ready = True
+    except PlaywrightTimeoutError:
+        ready = False
+    record_wait(name, started, ready)
+    return ready
+
+
+def wait_for_locator_hidden(
+    locator: Locator,
+    name: str,
+    timeout: int = DEFAULT_READY_TIMEOUT,
+) -> bool:
+    started = time.perf_counter()
+    try:
+        locator.wait_for(state="hidden", timeout=timeout)
+        ready = True
+    except PlaywrightTimeoutError:
+        ready = False
+    record_wait(name, started, ready)
+    return ready
+
+
+# =================================================
+# FORM READINESS
+# =================================================
+def wait_for_proforma_fielddata(
+    page: Page,
+    visit: dict,
+    timeout: int = DEFAULT_READY_TIMEOUT,
+) -> bool:
+    """
+    Waits until the visit's fielddata requests have been answered. The
+    counters are kept by ProformaCapture (helpers/form_extractors).
+
+    The sync API dispatches request events late, so a zero request count
+    does not mean "no ProForma": when the ProForma container is (or
+    becomes) present, at least one fielddata response is awaited.
+    """
+    if not visit.get("proforma_requested"):
+        has_proforma = wait_for_selector_ready(
+            page,
+            PROFORMA_CONTAINER_SELECTOR,
+            "proforma container",
+            timeout=PROFORMA_DETECT_TIMEOUT,
+            state="attached",
+        )
+        if not has_proforma and not visit.get("proforma_requested"):
+            return True
+
+    started = time.perf_counter()
+    deadline = started + timeout / 1000
+    ready = True
+
+    while not (0 < visit.get("proforma_requested", 0) <= visit.get("proforma_received", 0)):
+        if time.perf_counter() >= deadline:
+            ready = False
+            break
+        # Short slices keep Playwright dispatching the request/response handlers
+        page.wait_for_timeout(PROFORMA_POLL_MS)
+
+    record_wait("proforma fielddata", started, ready)
+    return ready
+
+
+def wait_for_form_ready(
+    page: Page,
+    visit: dict | None = None,
+    timeout: int = DEFAULT_READY_TIMEOUT,
+) -> bool:
+    """
+    Waits until the request form container is rendered and, for ProForma
+    forms, until their fielddata responses have arrived. Forms without
+    ProForma return once no ProForma container mounted within
+    PROFORMA_DETECT_TIMEOUT. Never raises on timeout: the
+    caller extracts whatever has rendered, as it did after the old fixed
+    sleeps.
+    """
+    rendered = wait_for_selector_ready(
+        page, FORM_READY_SELECTOR, "form rendered", timeout=timeout
+    )
+    if visit is None:
+        return rendered
+    return wait_for_proforma_fielddata(page, visit, timeout=timeout) and rendered
+
+
+# =================================================
+# OUTPUT – WAIT SUMMARY
+# =================================================
+def wait_summary() -> list[str]:
+    by_name = {}
+    for t in WAIT_TIMINGS:
+        by_name.setdefault(t["name"], []).append(t)
+
+    lines = []
+    for name, timings in sorted(by_name.items()):
+        seconds = [t["seconds"] for t in timings]
+        timeouts = sum(1 for t in timings if not t["ready"])
+        lines.append(
+            f"{name:<28} waits={len(timings):<5} "
+            f"avg={sum(seconds) / len(seconds):.2f}s "
+            f"max={max(seconds):.2f}s "
+            f"timeouts={timeouts}"
+        )
+    return lines
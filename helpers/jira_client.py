@@ -0,0 +1,194 @@
+import random
+import re
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from requests.auth import HTTPBasicAuth
+from config.config import CONFIG
+
+DEFAULT_TIMEOUT = 30
+DEFAULT_RETRIES = 5
+DEFAULT_BACKOFF = 1.0
+MAX_BACKOFF = 60.0
+DEFAULT_POOL_SIZE = 16
+
+# Optional per-instance keys in CONFIG (config/config.py):
+#   verify_ssl      False to skip TLS verification (default: verify)
+#   jira_retries    retries on 429/5xx/connection errors (DEFAULT_RETRIES)
+#   jira_backoff    base seconds of the exponential backoff (DEFAULT_BACKOFF)
+#   jira_timeout    per-request timeout in seconds (DEFAULT_TIMEOUT)
+#   jira_pool_size  keep-alive connections per host (DEFAULT_POOL_SIZE)
+
+RETRY_STATUSES = {429, 502, 503, 504}
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+
+# =================================================
+# HELPERS
+# =================================================
+def endpoint_key(method: str, path: str) -> str:
+    """
+    GET /rest/api/3/issue/SUP-12 -> GET /rest/api/3/issue/{id}
+    """
+    path = path.split("?", 1)[0]
+    # The API root keeps its version: /rest/api/3 is not an ID
+    root = re.match(r".*?/rest/[^/]+(/\d+(?=/|$))?", path)
+    prefix, path = (path[:root.end()], path[root.end():]) if root else ("", path)
+    path = re.sub(r"/(\d+|[A-Z][A-Z0-9]+-\d+)(?=/|$)", "/{id}", path)
+    return f"{method} {prefix}{path}"
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+# =================================================
+# POOLED JIRA REST CLIENT (ONE PER INSTANCE)
+# =================================================
+class JiraClient:
+    """
+    Keep-alive session for one Jira instance with retries on 429/5xx
+    (honouring Retry-After, otherwise jittered exponential backoff),
+    default timeouts and per-endpoint request/byte counters.
+
+    POST is only retried on 429, where Jira guarantees nothing was done.
+    """
+
+    def __init__(
+        self,
+        instance_key: str,
+        retries: int = DEFAULT_RETRIES,
+        backoff: float = DEFAULT_BACKOFF,
+        timeout: float = DEFAULT_TIMEOUT,
+        pool_size: int = DEFAULT_POOL_SIZE,
+    ):
+        cfg = CONFIG[instance_key]
+
+        self.instance_key = instance_key
+        self.base_url = cfg["base_url"]
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        self.session.auth = HTTPBasicAuth(cfg["email"], cfg["api_token"])
+        self.session.headers.update({"Accept": "application/json"})
+        self.session.verify = cfg.get("verify_ssl", True)
+        if not self.session.verify:
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self.stats: dict[str, dict] = {}
+        self._stats_lock = threading.Lock()
+
+    # ---------- STATS ----------
+    def _record(self, key: str, resp: requests.Response | None, retried: bool):
+        with self._stats_lock:
+            entry = self.stats.setdefault(key, {"requests": 0, "bytes": 0, "retries": 0})
+            entry["requests"] += 1
+            if resp is not None:
+                entry["bytes"] += len(resp.content)
+            if retried:
+                entry["retries"] += 1
+
+    def _backoff_delay(self, attempt: int) -> float:
+        return random.uniform(0, min(MAX_BACKOFF, self.backoff * 2 ** attempt))
+
+    # ---------- REQUESTS ----------
+    def request(self, method: str, path: str, **kwargs) -> requests.Response:
+        method = method.upper()
+        url = path if path.startswith("http") else self.base_url + path
+        key = endpoint_key(method, url[len(self.base_url):] if url.startswith(self.base_url) else url)
+        kwargs.setdefault("timeout", self.timeout)
+
+        for attempt in range(self.retries + 1):
+            last_attempt = attempt == self.retries
+
+            try:
+                resp = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                self._record(key, None, retried=not last_attempt)
+                if last_attempt or method not in IDEMPOTENT_METHODS:
+                    raise
+                time.sleep(self._backoff_delay(attempt))
+                continue
+
+            retryable = resp.status_code in RETRY_STATUSES and (
+                method in IDEMPOTENT_METHODS or resp.status_code == 429
+            )
+            self._record(key, resp, retried=retryable and not last_attempt)
+
+            if not retryable or last_attempt:
+                return resp
+
+            delay = parse_retry_after(resp.headers.get("Retry-After"))
+            time.sleep(min(MAX_BACKOFF, delay) if delay is not None else self._backoff_delay(attempt))
+
+        return resp
+
+    def get(self, path: str, **kwargs) -> requests.Response:
+        return self.request("GET", path, **kwargs)
+
+    def post(self, path: str, **kwargs) -> requests.Response:
+        return self.request("POST", path, **kwargs)
+
+    def put(self, path: str, **kwargs) -> requests.Response:
+        return self.request("PUT", path, **kwargs)
+
+    def delete(self, path: str, **kwargs) -> requests.Response:
+        return self.request("DELETE", path, **kwargs)
+
+    def get_json(self, path: str, params=None):
+        resp = self.get(path, params=params)
+        resp.raise_for_status()
+        return resp.json()
+
+
+_CLIENTS: dict[str, JiraClient] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+
+def get_jira_client(instance_key: str) -> JiraClient:
+    with _CLIENTS_LOCK:
+        if instance_key not in _CLIENTS:
+            cfg = CONFIG[instance_key]
+            _CLIENTS[instance_key] = JiraClient(
+                instance_key,
+                retries=cfg.get("jira_retries", DEFAULT_RETRIES),
+                backoff=cfg.get("jira_backoff", DEFAULT_BACKOFF),
+                timeout=cfg.get("jira_timeout", DEFAULT_TIMEOUT),
+                pool_size=cfg.get("jira_pool_size", DEFAULT_POOL_SIZE),
+            )
+        return _CLIENTS[instance_key]
+
+
+# =================================================
+# OUTPUT – REST USAGE SUMMARY
+# =================================================
+def client_stats_summary() -> list[str]:
+    lines = []
+    for instance_key, client in sorted(_CLIENTS.items()):
+        for key, entry in sorted(client.stats.items()):
+            lines.append(
+                f"{instance_key:<12} {key:<60} "
+                f"requests={entry['requests']:<5} "
+                f"retries={entry['retries']:<4} "
+                f"bytes={entry['bytes']}"
+            )
+    return lines
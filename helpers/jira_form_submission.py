@@ -1,38 +1,53 @@
-import requests
-import urllib3
-from requests.auth import HTTPBasicAuth
-from config.config import CONFIG
+from helpers.jira_client import get_jira_client
+from helpers.payload_template_cache import PayloadTemplateCache
 
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+# =================================================
+# DISCOVER REQUEST TYPES (REST, NO BROWSER)
+# =================================================
+def list_request_types(instance_key, service_desk_id, page_size=50) -> dict[str, str]:
+    """
+    Returns {request type name: request type id} for every request type
+    shown on the customer portal (types without a portal group are hidden).
+    """
+    client = get_jira_client(instance_key)
+    request_types = {}
+    start = 0
+
+    while True:
+        data = client.get_json(
+            f"/rest/servicedeskapi/servicedesk/{service_desk_id}/requesttype",
+            params={"start": start, "limit": page_size},
+        )
+        values = data.get("values", [])
+
+        for rt in values:
+            if rt.get("groupIds"):
+                request_types[rt["name"].strip()] = str(rt["id"])
+
+        if data.get("isLastPage", True) or not values:
+            break
+        start += len(values)
+
+    return request_types
 
 
 # =================================================
 # DISCOVER REST FIELDS
 # =================================================
 def discover_rest_fields(instance_key, service_desk_id, request_type_id):
-    cfg = CONFIG[instance_key]
-
-    url = (
-        f"{cfg['base_url']}/rest/servicedeskapi/servicedesk/"
+    data = get_jira_client(instance_key).get_json(
+        f"/rest/servicedeskapi/servicedesk/"
         f"{service_desk_id}/requesttype/{request_type_id}/field"
     )
 
-    resp = requests.get(
-        url,
-        auth=HTTPBasicAuth(cfg["email"], cfg["api_token"]),
-        headers={"Accept": "application/json"},
-        verify=False,
-    )
-
-    resp.raise_for_status()
-
     return {
         f["fieldId"]: {
             "name": f["name"],
             "required": f["required"],
             "schema": f.get("schema", {}),
         }
-        for f in resp.json().get("requestTypeFields", [])
+        for f in data.get("requestTypeFields", [])
     }
 
 
@@ -68,44 +83,115 @@ def build_payload_fields(rest_fields, request_type_name):
 # =================================================
 # CREATE REQUEST
 # =================================================
+def is_field_validation_error(resp) -> bool:
+    """
+    servicedeskapi rejects invalid/missing requestFieldValues with 400 and
+    names the fields in the body; other 400s (bad ids, permissions) are not
+    a reason to rebuild the payload.
+    """
+    if resp.status_code != 400:
+        return False
+
+    try:
+        body = resp.json()
+    except ValueError:
+        return False
+    if not isinstance(body, dict):
+        return False
+
+    if body.get("errors"):
+        return True
+
+    message = f"{body.get('errorMessage', '')} {body.get('i18nErrorMessage', '')}".lower()
+    return "requestfieldvalues" in message or "field" in message
+
+
+def post_request(instance_key, service_desk_id, request_type_id, fields):
+    payload = {
+        "serviceDeskId": service_desk_id,
+        "requestTypeId": request_type_id,
+        "requestFieldValues": fields,
+    }
+
+    return get_jira_client(instance_key).post(
+        "/rest/servicedeskapi/request",
+        json=payload,
+    )
+
+
 def create_request(
     instance_key: str,
     service_desk_id: str,
     request_type_id: str,
     request_type_name: str,
+    template_cache: PayloadTemplateCache | None = None,
 ):
-    cfg = CONFIG[instance_key]
+    rest_fields = None
 
-    rest_fields = discover_rest_fields(
-        instance_key,
-        service_desk_id,
-        request_type_id,
+    # ---- CACHED PAYLOAD: SUBMIT DIRECTLY (NO DISCOVERY CALL) ----
+    cached = (
+        template_cache.get(instance_key, service_desk_id, request_type_id)
+        if template_cache else None
     )
 
-    payload = {
-        "serviceDeskId": service_desk_id,
-        "requestTypeId": request_type_id,
-        "requestFieldValues": build_payload_fields(
-            rest_fields,
-            request_type_name,
-        ),
-    }
+    if cached:
+        resp = post_request(instance_key, service_desk_id, request_type_id, cached["fields"])
+
+        if resp.status_code == 201:
+            return {
+                "status_code": resp.status_code,
+                "body": resp.json(),
+                "cached": True,
+            }
+
+        if not is_field_validation_error(resp):
+            raise RuntimeError(
+                f"Request creation failed "
+                f"(status={resp.status_code}): {resp.text}"
+            )
+
+        # Field error: only a changed schema can produce a different payload
+        rest_fields = discover_rest_fields(
+            instance_key,
+            service_desk_id,
+            request_type_id,
+        )
+        if not template_cache.schema_changed(cached, rest_fields):
+            raise RuntimeError(
+                f"Request creation failed with an unchanged field schema "
+                f"(status={resp.status_code}): {resp.text}"
+            )
+
+        template_cache.invalidate(instance_key, service_desk_id, request_type_id)
+
+    # ---- DISCOVER + BUILD ----
+    if rest_fields is None:
+        rest_fields = discover_rest_fields(
+            instance_key,
+            service_desk_id,
+            request_type_id,
+        )
 
-    resp = requests.post(
-        f"{cfg['base_url']}/rest/servicedeskapi/request",
-        json=payload,
-        auth=HTTPBasicAuth(cfg["email"], cfg["api_token"]),
-        headers={"Accept": "application/json"},
-        verify=False,
+    fields = build_payload_fields(
+        rest_fields,
+        request_type_name,
     )
 
+    resp = post_request(instance_key, service_desk_id, request_type_id, fields)
+
     if resp.status_code != 201:
         raise RuntimeError(
             f"Request creation failed "
             f"(status={resp.status_code}): {resp.text}"
         )
 
+    if template_cache:
+        template_cache.store(
+            instance_key, service_desk_id, request_type_id, rest_fields, fields
+        )
+
     return {
         "status_code": resp.status_code,
         "body": resp.json(),
+        "cached": False,
     }
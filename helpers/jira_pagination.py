@@ -0,0 +1,79 @@
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Iterator
+
+from helpers.jira_client import JiraClient
+
+DEFAULT_PAGE_SIZE = 50
+DEFAULT_PAGE_CONCURRENCY = 4
+
+
+# =================================================
+# CONCURRENT PAGINATED FETCH (startAt / maxResults / total)
+# =================================================
+def paginate(
+    client: JiraClient,
+    path: str,
+    params: dict | None = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+    items_key: str = "values",
+) -> Iterator[dict]:
+    """
+    Yields every item of a Jira list endpoint as pages arrive.
+
+    The first page is fetched alone to learn `total` and the page size the
+    server actually honours; the remaining pages are then fetched with at
+    most `concurrency` requests in flight. Items are yielded in page
+    completion order, not in startAt order. Endpoints that do not return
+    `total` are walked serially until `isLast` or an empty page.
+    """
+    params = dict(params or {})
+
+    def fetch(start_at: int) -> dict:
+        return client.get_json(
+            path, params={**params, "startAt": start_at, "maxResults": page_size}
+        )
+
+    first = fetch(0)
+    values = first.get(items_key, [])
+    yield from values
+
+    if not values or first.get("isLast"):
+        return
+
+    step = first.get("maxResults") or len(values)
+    total = first.get("total")
+
+    # ---------- NO TOTAL: SERIAL ----------
+    if total is None:
+        start_at = len(values)
+        while True:
+            data = fetch(start_at)
+            values = data.get(items_key, [])
+            yield from values
+            if not values or data.get("isLast"):
+                return
+            start_at += len(values)
+
+    # ---------- TOTAL KNOWN: BOUNDED CONCURRENCY ----------
+    offsets = iter(range(step, total, step))
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        in_flight = set()
+        try:
+            for start_at in offsets:
+                in_flight.add(pool.submit(fetch, start_at))
+                if len(in_flight) >= concurrency:
+                    break
+
+            while in_flight:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result().get(items_key, [])
+
+                    start_at = next(offsets, None)
+                    if start_at is not None:
+                        in_flight.add(pool.submit(fetch, start_at))
+        finally:
+            for future in in_flight:
+                future.cancel()
@@ -0,0 +1,113 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+
+DEFAULT_LINK_CONCURRENCY = 16
+DEFAULT_PER_HOST_LIMIT = 8
+MAX_REDIRECTS = 5
+LINK_TIMEOUT = 30
+
+
+# =================================================
+# CONCURRENT LINK CHECKER
+# =================================================
+class LinkChecker:
+    """
+    Checks many URLs concurrently over one pooled requests.Session that
+    carries the BrowserContext cookies (same auth as page.request).
+
+    head_first=True sends HEAD and falls back to GET when the server does
+    not answer HEAD with a success; GET responses are streamed and closed
+    without reading the body. Use it as a context manager (or call
+    close()) to release the pooled connections. verify=False (the
+    instance's verify_ssl config key) skips TLS verification.
+    """
+
+    def __init__(
+        self,
+        cookies: list[dict],
+        concurrency: int = DEFAULT_LINK_CONCURRENCY,
+        per_host: int = DEFAULT_PER_HOST_LIMIT,
+        head_first: bool = True,
+        verify: bool = True,
+    ):
+        self.concurrency = max(1, concurrency)
+        self.per_host = max(1, per_host)
+        self.head_first = head_first
+
+        self.session = requests.Session()
+        self.session.verify = verify
+        if not verify:
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+        self.session.max_redirects = MAX_REDIRECTS
+
+        adapter = HTTPAdapter(pool_connections=self.per_host, pool_maxsize=self.per_host)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        for c in cookies:
+            self.session.cookies.set(
+                c["name"], c["value"], domain=c.get("domain", ""), path=c.get("path", "/")
+            )
+
+        self._host_limits: dict[str, threading.Semaphore] = {}
+        self._host_lock = threading.Lock()
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self) -> "LinkChecker":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _host_limit(self, url: str) -> threading.Semaphore:
+        host = urlparse(url).netloc
+        with self._host_lock:
+            if host not in self._host_limits:
+                self._host_limits[host] = threading.Semaphore(self.per_host)
+            return self._host_limits[host]
+
+    def _send(self, method: str, url: str) -> requests.Response:
+        resp = self.session.request(
+            method, url, allow_redirects=True, stream=True, timeout=LINK_TIMEOUT
+        )
+        resp.close()
+        return resp
+
+    def check(self, url: str) -> dict:
+        started = time.perf_counter()
+        result = {"url": url, "method": None, "status": None, "final_url": None, "error": None}
+
+        with self._host_limit(url):
+            try:
+                resp = None
+                if self.head_first:
+                    resp = self._send("HEAD", url)
+                    result["method"] = "HEAD"
+
+                if resp is None or resp.status_code >= 400:
+                    resp = self._send("GET", url)
+                    result["method"] = "GET"
+
+                result["status"] = resp.status_code
+                result["final_url"] = resp.url
+            except Exception as e:
+                result["error"] = str(e)
+
+        result["latency"] = time.perf_counter() - started
+        return result
+
+    def check_all(self, urls: dict[str, str]) -> dict[str, dict]:
+        """
+        {name: url} -> {name: result}, in input order.
+        """
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            results = pool.map(self.check, urls.values())
+            return dict(zip(urls.keys(), results))
@@ -35,7 +35,9 @@ def get_logger(name: str, log_dir: str, filename_prefix: str):
         file_handler = logging.FileHandler(log_file, mode="w", encoding="utf-8")
         file_handler.setFormatter(formatter)
 
-        console_handler = logging.StreamHandler()
+        # The real stderr: sys.stderr may already be another module's
+        # StdoutToLogger when several modules share one session
+        console_handler = logging.StreamHandler(sys.__stderr__)
         console_handler.setFormatter(formatter)
 
         logger.addHandler(file_handler)
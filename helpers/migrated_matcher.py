@@ -0,0 +1,131 @@
+import re
+from datetime import date, datetime, timedelta
+
+# "(migrated)", "(migrated 2)", "(Migrated3)" ...
+NAME_MIGRATED_REGEX = re.compile(r"\(migrated(?:\s*\d+)?\)", re.IGNORECASE)
+
+MIGRATED_DATE_FORMAT = "%d %b %Y"
+
+# "Migrated on 16 Jan 2026" / "(Migrated on 16 Jan 2026 ...)"
+DESCRIPTION_DATE_REGEX = re.compile(
+    r"migrated\s+on\s+(\d{1,2}\s+[A-Za-z]{3}\s+\d{4})", re.IGNORECASE
+)
+SCHEME_DATE_REGEX = re.compile(
+    r"\(migrated\s+on\s+(\d{1,2}\s+[A-Za-z]{3}\s+\d{4}).*?\)", re.IGNORECASE
+)
+
+# Bucket used when no --migrated-date is given
+ANY_DATE = "any date"
+
+
+# =================================================
+# --migrated-date PARSING
+# =================================================
+def parse_migrated_date(value: str) -> date:
+    return datetime.strptime(" ".join(value.split()), MIGRATED_DATE_FORMAT).date()
+
+
+def parse_migrated_dates(value: str | None) -> list[str]:
+    """
+    "16 Jan 2026"                   -> ["16 Jan 2026"]
+    "16 Jan 2026, 20 Feb 2026"      -> ["16 Jan 2026", "20 Feb 2026"]
+    "16 Jan 2026..18 Jan 2026"      -> ["16 Jan 2026", "17 Jan 2026", "18 Jan 2026"]
+
+    Lists and ranges can be mixed: "2 Jan 2026, 16 Jan 2026..18 Jan 2026".
+    """
+    if not value:
+        return []
+
+    dates = []
+    for part in re.split(r"[,;]", value):
+        part = part.strip()
+        if not part:
+            continue
+
+        if ".." in part:
+            start_text, end_text = (p.strip() for p in part.split("..", 1))
+            start = parse_migrated_date(start_text)
+            end = parse_migrated_date(end_text)
+            if end < start:
+                raise ValueError(f"Invalid --migrated-date range: {part}")
+
+            day = start
+            while day <= end:
+                dates.append(day.strftime(MIGRATED_DATE_FORMAT))
+                day += timedelta(days=1)
+        else:
+            parse_migrated_date(part)
+            dates.append(" ".join(part.split()))
+
+    return list(dict.fromkeys(dates))
+
+
+# =================================================
+# MIGRATED MATCHER (ONE PER --migrated-date)
+# =================================================
+class MigratedMatcher:
+    """
+    Precompiled migrated-object rules shared by every global check.
+
+    `migrated_date` may be one date, a list or a range (see
+    parse_migrated_dates). Every rule returns the date bucket an object
+    falls into, or None. The date is extracted once per object and looked
+    up, so checking N migration waves costs the same as checking one.
+    Without a migrated date every date rule passes with bucket ANY_DATE,
+    so only the "(migrated)" name tag decides.
+    """
+
+    def __init__(self, migrated_date: str | None):
+        self.migrated_date = migrated_date
+        self.labels = parse_migrated_dates(migrated_date)
+        self.buckets = {parse_migrated_date(label): label for label in self.labels}
+
+    def _bucket_for_text(self, regex: re.Pattern, text: str) -> str | None:
+        if not self.buckets:
+            return ANY_DATE
+
+        for m in regex.finditer(text or ""):
+            try:
+                label = self.buckets.get(parse_migrated_date(m.group(1)))
+            except ValueError:
+                continue
+            if label:
+                return label
+        return None
+
+    # ---------- RULES ----------
+    def name_tagged(self, name: str) -> bool:
+        return NAME_MIGRATED_REGEX.search(name or "") is not None
+
+    def description_bucket(self, description: str) -> str | None:
+        return self._bucket_for_text(DESCRIPTION_DATE_REGEX, description)
+
+    def updated_bucket(self, updated: str) -> str | None:
+        """
+        Jira workflow API does NOT return description.
+        We rely on 'updated' timestamp to match CLI date.
+
+        updated format: YYYY-MM-DD HH:MM:SS.ssssss
+        """
+        if not self.buckets:
+            return ANY_DATE
+        try:
+            return self.buckets.get(datetime.fromisoformat(updated).date())
+        except (TypeError, ValueError):
+            return None
+
+    def scheme_bucket(self, name: str, description: str) -> str | None:
+        combined = f"{name} {description or ''}"
+        if not self.buckets:
+            return ANY_DATE if self.name_tagged(combined) else None
+        return self._bucket_for_text(SCHEME_DATE_REGEX, combined)
+
+    # ---------- BOOLEAN FORMS ----------
+    def description_matches(self, description: str) -> bool:
+        return self.description_bucket(description) is not None
+
+    def updated_matches(self, updated: str) -> bool:
+        return self.updated_bucket(updated) is not None
+
+    def scheme_matches(self, name: str, description: str) -> bool:
+        return self.scheme_bucket(name, description) is not None
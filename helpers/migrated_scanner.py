@@ -0,0 +1,184 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator
+
+from helpers.jira_client import JiraClient
+from helpers.jira_pagination import paginate
+from helpers.migrated_matcher import MigratedMatcher
+
+# =================================================
+# OBJECT TYPES
+# =================================================
+# rule:
+#   description -> description carries the migration date AND name is tagged
+#   updated     -> 'updated' timestamp is the migration date AND name is tagged
+#   scheme      -> "(migrated on <date> ...)" in name/description
+# name_query: search parameter used to pre-filter names on the server
+OBJECT_TYPES = {
+    "custom_field": {
+        "label": "Custom fields",
+        "path": "/rest/api/3/field/search",
+        "params": {"type": "custom"},
+        "name_query": "query",
+        "rule": "description",
+    },
+    "status": {
+        "label": "Statuses",
+        "path": "/rest/api/3/statuses/search",
+        "name_query": "searchString",
+        "rule": "description",
+    },
+    "workflow": {
+        "label": "Workflows",
+        "path": "/rest/api/3/workflows/search",
+        "name_query": "queryString",
+        "rule": "updated",
+    },
+    "workflow_scheme": {
+        "label": "Workflow schemes",
+        "path": "/rest/api/3/workflowscheme",
+        "rule": "scheme",
+    },
+    "screen": {
+        "label": "Screens",
+        "path": "/rest/api/3/screens",
+        "name_query": "queryString",
+        "rule": "description",
+    },
+    "issue_type": {
+        "label": "Issue types",
+        "path": "/rest/api/3/issuetype",
+        "paginated": False,
+        "rule": "description",
+    },
+    "resolution": {
+        "label": "Resolutions",
+        "path": "/rest/api/3/resolution/search",
+        "rule": "description",
+    },
+}
+
+
+# =================================================
+# FETCH + MATCH
+# =================================================
+def fetch_objects(client: JiraClient, spec: dict, name_query: str | None) -> Iterator[dict]:
+    params = dict(spec.get("params", {}))
+    if name_query and spec.get("name_query"):
+        params[spec["name_query"]] = name_query
+
+    if spec.get("paginated", True):
+        yield from paginate(client, spec["path"], params=params)
+    else:
+        yield from client.get_json(spec["path"], params=params)
+
+
+def offending_bucket(obj: dict, rule: str, matcher: MigratedMatcher) -> str | None:
+    """
+    Returns the migration date bucket of an offending object, else None.
+    """
+    name = obj.get("name", "")
+    description = obj.get("description") or ""
+
+    if rule == "scheme":
+        return matcher.scheme_bucket(name, description)
+
+    if not matcher.name_tagged(name):
+        return None
+    if rule == "description":
+        return matcher.description_bucket(description)
+    if rule == "updated":
+        return matcher.updated_bucket(obj.get("updated", ""))
+
+    raise ValueError(f"Unknown migrated rule: {rule}")
+
+
+def scan_object_type(
+    client: JiraClient,
+    spec: dict,
+    matcher: MigratedMatcher,
+    name_query: str | None,
+) -> list[dict]:
+    offending = []
+
+    for obj in fetch_objects(client, spec, name_query):
+        bucket = offending_bucket(obj, spec["rule"], matcher)
+        if bucket:
+            offending.append({
+                "Migrated Date": bucket,
+                "ID": obj.get("id", ""),
+                "Name": obj.get("name", ""),
+                "Description": obj.get("description") or "",
+                "Last Updated": obj.get("updated", ""),
+            })
+
+    return offending
+
+
+# =================================================
+# SINGLE-PASS SCAN (ALL TYPES CONCURRENTLY)
+# =================================================
+def scan_instance(
+    client: JiraClient,
+    matcher: MigratedMatcher,
+    name_query: str | None = None,
+    object_types: list[str] | None = None,
+) -> dict:
+    """
+    Fetches every object type concurrently and returns one report:
+    {"offending": {type: [...]}, "errors": {type: "reason"}}
+    """
+    object_types = object_types or list(OBJECT_TYPES)
+    report = {"offending": {}, "errors": {}}
+
+    with ThreadPoolExecutor(max_workers=len(object_types)) as pool:
+        futures = {
+            t: pool.submit(scan_object_type, client, OBJECT_TYPES[t], matcher, name_query)
+            for t in object_types
+        }
+
+        for t, future in futures.items():
+            try:
+                report["offending"][t] = future.result()
+            except Exception as e:
+                report["errors"][t] = str(e)
+
+    return report
+
+
+# =================================================
+# OUTPUT – CONSOLIDATED REPORT
+# =================================================
+def group_by_bucket(items: list[dict]) -> dict[str, list[dict]]:
+    buckets = {}
+    for item in items:
+        buckets.setdefault(item["Migrated Date"], []).append(item)
+    return buckets
+
+
+def print_scan_report(instance_key: str, migrated_date: str | None, report: dict):
+    print(f"\n================ GLOBAL MIGRATED ARTIFACTS: {instance_key} =================\n")
+    print(f"Migration date(s) : {migrated_date or 'any'}\n")
+
+    for t, spec in OBJECT_TYPES.items():
+        if t in report["errors"]:
+            print(f"❌ {spec['label']}: could not be scanned ({report['errors'][t]})\n")
+            continue
+        if t not in report["offending"]:
+            continue
+
+        items = report["offending"][t]
+        if not items:
+            print(f"✅ {spec['label']}: no migrated tag found\n")
+            continue
+
+        print(f"❌ {spec['label']} still having migrated tag ({len(items)})")
+        for bucket, bucket_items in group_by_bucket(items).items():
+            print(f"\n  📅 {bucket} ({len(bucket_items)})")
+            for item in bucket_items:
+                print(f"  - {item['Name']}")
+                print(f"    ID           : {item['ID']}")
+                if item["Description"]:
+                    print(f"    Description  : {item['Description']}")
+                if item["Last Updated"]:
+                    print(f"    Last Updated : {item['Last Updated']}")
+        print()
@@ -0,0 +1,73 @@
+import hashlib
+import json
+import os
+import threading
+import time
+
+PAYLOAD_CACHE_FILE = ".cache/payload_templates.json"
+
+
+def schema_hash(rest_fields: dict) -> str:
+    """
+    Stable hash of a request type's requestTypeFields (as returned by
+    discover_rest_fields), used to tell when a cached payload is stale.
+    """
+    canonical = json.dumps(rest_fields, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+# =================================================
+# PERSISTENT PAYLOAD TEMPLATES
+# =================================================
+class PayloadTemplateCache:
+    """
+    {instance|service desk|request type: {"schema_hash", "fields", "stored_at"}}
+
+    An entry is written after a successful submission and its fields are
+    submitted without any discovery call. Only when that submission is
+    rejected with a field error are the fields rediscovered: a changed
+    schema hash replaces the entry, an unchanged one means rebuilding
+    would produce the same payload, so the error is reported instead.
+    """
+
+    def __init__(self, path: str = PAYLOAD_CACHE_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+        self.entries: dict[str, dict] = {}
+
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self.entries = json.load(f)
+
+    @staticmethod
+    def key(instance_key: str, service_desk_id: str, request_type_id: str) -> str:
+        return f"{instance_key}|{service_desk_id}|{request_type_id}"
+
+    def get(self, instance_key, service_desk_id, request_type_id) -> dict | None:
+        with self._lock:
+            return self.entries.get(self.key(instance_key, service_desk_id, request_type_id))
+
+    @staticmethod
+    def schema_changed(entry: dict, rest_fields: dict) -> bool:
+        return entry.get("schema_hash") != schema_hash(rest_fields)
+
+    def store(self, instance_key, service_desk_id, request_type_id, rest_fields, fields):
+        with self._lock:
+            self.entries[self.key(instance_key, service_desk_id, request_type_id)] = {
+                "schema_hash": schema_hash(rest_fields),
+                "fields": fields,
+                "stored_at": time.time(),
+            }
+            self._save()
+
+    def invalidate(self, instance_key, service_desk_id, request_type_id):
+        with self._lock:
+            if self.entries.pop(self.key(instance_key, service_desk_id, request_type_id), None):
+                self._save()
+
+    def _save(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.entries, f, indent=2)
+        os.replace(tmp, self.path)
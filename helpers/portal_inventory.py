@@ -0,0 +1,86 @@
+import json
+import os
+import time
+
+from playwright.sync_api import BrowserContext
+
+from config.config import CONFIG
+from helpers.collect_request_type_links import collect_request_links
+
+INVENTORY_CACHE_DIR = ".cache/portal_inventory"
+
+
+# =================================================
+# PORTAL INVENTORY (REQUEST TYPE LINKS PER INSTANCE)
+# =================================================
+class PortalInventory:
+    """
+    {request type name: href} per instance, scraped at most once per run.
+
+    ttl > 0 also persists each instance's map to INVENTORY_CACHE_DIR and
+    reuses it across runs while it is younger than `ttl` seconds;
+    refresh=True ignores the disk copy and scrapes again.
+    """
+
+    def __init__(self, contexts: dict[str, BrowserContext], ttl: int = 0, refresh: bool = False):
+        self.contexts = contexts
+        self.ttl = ttl
+        self.refresh = refresh
+        self._links: dict[str, dict[str, str]] = {}
+
+    def cache_file(self, instance_key: str) -> str:
+        return os.path.join(INVENTORY_CACHE_DIR, f"{instance_key}.json")
+
+    # ---------- DISK ----------
+    def _load_from_disk(self, instance_key: str) -> dict[str, str] | None:
+        path = self.cache_file(instance_key)
+        if self.ttl <= 0 or self.refresh or not os.path.exists(path):
+            return None
+
+        # A truncated or hand-edited cache is a miss: scrape again
+        try:
+            with open(path, encoding="utf-8") as f:
+                cached = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+        if not isinstance(cached, dict) or time.time() - cached.get("fetched_at", 0) > self.ttl:
+            return None
+        return cached.get("links")
+
+    def _save_to_disk(self, instance_key: str, links: dict[str, str]):
+        if self.ttl <= 0:
+            return
+
+        # Write-then-rename: a concurrent or interrupted run never reads a partial file
+        path = self.cache_file(instance_key)
+        os.makedirs(INVENTORY_CACHE_DIR, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"fetched_at": time.time(), "links": links}, f, indent=2)
+        os.replace(tmp, path)
+
+    # ---------- SCRAPE ----------
+    def _scrape(self, instance_key: str) -> dict[str, str]:
+        cfg = CONFIG[instance_key]
+
+        page = self.contexts[instance_key].new_page()
+        try:
+            page.goto(cfg["base_url"] + cfg["portal"], wait_until="domcontentloaded")
+            return collect_request_links(page)
+        finally:
+            page.close()
+
+    def links(self, instance_key: str) -> dict[str, str]:
+        """
+        Returns a copy, so callers may modify it freely.
+        """
+        if instance_key not in self._links:
+            links = self._load_from_disk(instance_key)
+            if links is None:
+                links = self._scrape(instance_key)
+                if links:
+                    self._save_to_disk(instance_key, links)
+            self._links[instance_key] = links
+
+        return dict(self._links[instance_key])
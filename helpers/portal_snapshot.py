@@ -0,0 +1,157 @@
+import os
+
+from playwright.sync_api import BrowserContext, Page
+
+from config.config import CONFIG
+from helpers.crawl_checkpoint import CrawlCheckpoint
+from helpers.form_crawler import DEFAULT_CRAWL_PAGES, crawl_forms
+from helpers.form_extractors import FORM_EXTRACTORS, ProformaCapture
+from helpers.form_readiness import wait_for_form_ready
+from helpers.portal_inventory import PortalInventory
+
+
+# =================================================
+# PORTAL SNAPSHOT (ONE VISIT PER FORM, ALL EXTRACTORS)
+# =================================================
+class PortalSnapshot:
+    """
+    Crawls every request type form of an instance once, runs all
+    registered extractors on the loaded page and keeps the results:
+
+      {"forms":  {request type: {extractor name: data, ...}},
+       "errors": {request type: reason}}
+
+    Validation modules compare from this snapshot instead of navigating.
+
+    With prefetch=True (default outside pytest-xdist) the first form()
+    lookup crawls the whole instance through the page pool. Under xdist
+    every worker only owns a slice of the per-form test items, so form()
+    crawls just the requested form and keeps it. `only` limits
+    the instance crawl to the request types selected for this run
+    (--shard, -k, -m); an empty set crawls nothing, None every form.
+
+    Every extracted form is appended to `checkpoint`; resume=True restores
+    the forms already in it instead of crawling them again.
+    """
+
+    def __init__(
+        self,
+        contexts: dict[str, BrowserContext],
+        portal_inventory: PortalInventory,
+        pages: int = DEFAULT_CRAWL_PAGES,
+        extractors: dict | None = None,
+        prefetch: bool | None = None,
+        only: set[str] | None = None,
+        checkpoint: CrawlCheckpoint | None = None,
+        resume: bool = False,
+    ):
+        self.contexts = contexts
+        self.portal_inventory = portal_inventory
+        self.pages = pages
+        self.extractors = extractors or FORM_EXTRACTORS
+        self.only = only
+        self.prefetch = "PYTEST_XDIST_WORKER" not in os.environ if prefetch is None else prefetch
+        self._instances: dict[str, dict] = {}
+        self.checkpoint = checkpoint
+        self.resume = resume
+        self._forms: dict[tuple[str, str], dict] = {}
+        self._restored: dict[str, dict[str, dict]] = {}
+
+    def _extract(self, page: Page, visit: dict) -> dict:
+        wait_for_form_ready(page, visit)
+        return {name: fn(page, visit) for name, fn in self.extractors.items()}
+
+    def restored(self, instance_key: str) -> dict[str, dict]:
+        """
+        Forms of the instance already in the checkpoint (only with resume).
+        """
+        if not (self.resume and self.checkpoint):
+            return {}
+        if instance_key not in self._restored:
+            # Entries written with another extractor set are crawled again
+            self._restored[instance_key] = {
+                name: data
+                for name, data in self.checkpoint.completed(instance_key).items()
+                if set(self.extractors) <= set(data)
+            }
+            print(
+                f"↺ {instance_key}: {len(self._restored[instance_key])} form(s) "
+                f"restored from checkpoint {self.checkpoint.run_id}"
+            )
+        return self._restored[instance_key]
+
+    def _crawl(self, instance_key: str, links: dict[str, str] | None = None) -> dict:
+        capture = ProformaCapture()
+
+        if links is None:
+            links = self.portal_inventory.links(instance_key)
+            if self.only is not None:
+                links = {name: href for name, href in links.items() if name in self.only}
+
+        done = self.restored(instance_key)
+        restored = {name: done[name] for name in links if name in done}
+        links = {name: href for name, href in links.items() if name not in restored}
+
+        def extract(page: Page, visit: dict) -> dict:
+            data = self._extract(page, visit)
+            if self.checkpoint:
+                self.checkpoint.record(instance_key, visit["name"], data)
+            return data
+
+        forms, errors = crawl_forms(
+            self.contexts[instance_key],
+            CONFIG[instance_key]["base_url"],
+            links,
+            extract,
+            pages=self.pages,
+            on_page_open=capture.attach,
+            before_navigation=capture.begin,
+        )
+
+        return {"forms": {**restored, **forms}, "errors": errors}
+
+    def instance(self, instance_key: str) -> dict:
+        if instance_key not in self._instances:
+            self._instances[instance_key] = self._crawl(instance_key)
+        return self._instances[instance_key]
+
+    def form(self, instance_key: str, name: str) -> dict | None:
+        """
+        {extractor name: data} of one form, None when the portal does not
+        list it. Raises RuntimeError when the form could not be collected.
+        """
+        if self.prefetch:
+            snapshot = self.instance(instance_key)
+        else:
+            key = (instance_key, name)
+            if key not in self._forms:
+                links = self.portal_inventory.links(instance_key)
+                if name not in links:
+                    return None
+                self._forms[key] = self._crawl(instance_key, {name: links[name]})
+            snapshot = self._forms[key]
+
+        if name in snapshot["errors"]:
+            raise RuntimeError(snapshot["errors"][name])
+        return snapshot["forms"].get(name)
+
+    def loaded_facet(self, instance_key: str, extractor: str) -> dict[str, object]:
+        """
+        Like facet(), but only for forms this snapshot has already crawled;
+        never starts a crawl.
+        """
+        forms = dict(self._instances.get(instance_key, {}).get("forms", {}))
+        for (key, _), snapshot in self._forms.items():
+            if key == instance_key:
+                forms.update(snapshot["forms"])
+        return {name: data[extractor] for name, data in forms.items()}
+
+    def facet(self, instance_key: str, extractor: str) -> dict[str, object]:
+        """
+        {request type: data of one extractor} for the forms that loaded.
+        """
+        forms = self.instance(instance_key)["forms"]
+        return {name: data[extractor] for name, data in forms.items()}
+
+    def errors(self, instance_key: str) -> dict[str, str]:
+        return self.instance(instance_key)["errors"]
@@ -0,0 +1,72 @@
+import functools
+import re
+from typing import Callable
+
+import pytest
+
+from config.config import CONFIG
+from helpers.jira_form_submission import list_request_types
+
+
+def get_service_desk_id_from_portal(portal: str) -> str:
+    m = re.search(r"/portal/(\d+)", portal)
+    if not m:
+        raise RuntimeError(f"Cannot extract serviceDeskId from {portal}")
+    return m.group(1)
+
+
+# =================================================
+# COLLECTION-TIME INVENTORY (REST, NO BROWSER)
+# =================================================
+@functools.lru_cache(maxsize=None)
+def request_type_ids(instance_key: str) -> dict[str, str]:
+    """
+    {request type name: id} of the instance's portal, fetched once per
+    process. Cheap enough to run at collection time, where it drives
+    the per-request-type test items (one item per form, so pytest-xdist
+    can distribute them).
+    """
+    service_desk_id = get_service_desk_id_from_portal(CONFIG[instance_key]["portal"])
+    return list_request_types(instance_key, service_desk_id)
+
+
+def request_type_names(*instance_keys: str) -> list[str]:
+    """
+    Sorted union of the request type names of the given instances
+    (all configured instances when none are given). The order must be
+    identical in every xdist worker, hence sorted.
+    """
+    names = set()
+    for instance_key in instance_keys or CONFIG:
+        names.update(request_type_ids(instance_key))
+    return sorted(names)
+
+
+# =================================================
+# PARAMETRIZE (INVENTORY ERRORS BECOME ONE FAILING ITEM)
+# =================================================
+class InventoryUnavailable(str):
+    """
+    Placeholder parameter when the inventory could not be fetched at
+    collection; conftest fails every item that receives it.
+    """
+
+
+def parametrize_from_inventory(metafunc, argname: str, fetch: Callable[[], list[str]]):
+    """
+    metafunc.parametrize(argname, fetch()), except that a failing fetch
+    (network, expired token) or an empty inventory yields one failing item
+    instead of breaking the collection or skipping the whole module.
+    """
+    try:
+        values = fetch()
+        problem = None if values else "the inventory is empty (likely an auth issue)"
+    except Exception as e:
+        problem = str(e)
+
+    if problem:
+        reason = InventoryUnavailable(f"inventory unavailable: {problem}")
+        metafunc.parametrize(argname, [pytest.param(reason, id="inventory-unavailable")])
+        return
+
+    metafunc.parametrize(argname, values)
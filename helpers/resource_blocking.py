@@ -0,0 +1,117 @@
+import re
+from collections import Counter
+from urllib.parse import urlparse
+
+from playwright.sync_api import BrowserContext, Request, Response, Route
+
+# Requests the scrapers depend on are never blocked
+ALWAYS_ALLOW_REGEX = re.compile(
+    r"/gateway/api/proforma/|/rest/servicedesk|/rest/servicedeskapi/|/servicedesk/customer/",
+    re.IGNORECASE,
+)
+
+# =================================================
+# PROFILES
+# =================================================
+# resource_types      Playwright resource types aborted on every host
+# block_third_party   abort hosts that are not the instance or first_party
+# blocked_urls        analytics / telemetry endpoints aborted everywhere
+BLOCK_PROFILES = {
+    "none": None,
+    "scrape": {
+        "resource_types": {"image", "media", "font"},
+        "block_third_party": True,
+        "first_party": ("atlassian.net", "atlassian.com", "atl-paas.net"),
+        "blocked_urls": re.compile(
+            r"/gasv3/|/analytics|/telemetry|sentry|segment\.(io|com)|statsig|"
+            r"newrelic|nr-data|google-analytics|googletagmanager|optimizely",
+            re.IGNORECASE,
+        ),
+    },
+}
+
+_BLOCKERS: list["ResourceBlocker"] = []
+
+
+# =================================================
+# REQUEST INTERCEPTION
+# =================================================
+class ResourceBlocker:
+    """
+    Aborts non-essential requests of one BrowserContext according to a
+    profile and counts what was blocked and what was loaded.
+
+    Note: Playwright disables the HTTP cache of a context once it is
+    routed, so this only pays off when the blocked assets outweigh the
+    scripts that are then re-fetched for every form.
+    """
+
+    def __init__(self, instance_key: str, base_url: str, profile_name: str):
+        self.instance_key = instance_key
+        self.profile_name = profile_name
+        self.profile = BLOCK_PROFILES[profile_name]
+        self.instance_host = urlparse(base_url).hostname or ""
+
+        self.blocked = Counter()
+        self.allowed = 0
+        self.loaded_bytes = 0
+
+    def install(self, context: BrowserContext):
+        if not self.profile:
+            return
+        context.route("**/*", self._handle)
+        context.on("response", self._on_response)
+        _BLOCKERS.append(self)
+
+    def _third_party(self, host: str) -> bool:
+        if host == self.instance_host:
+            return False
+        return not any(
+            host == suffix or host.endswith("." + suffix)
+            for suffix in self.profile["first_party"]
+        )
+
+    def block_reason(self, request: Request) -> str | None:
+        url = request.url
+        if ALWAYS_ALLOW_REGEX.search(url):
+            return None
+
+        if request.resource_type in self.profile["resource_types"]:
+            return request.resource_type
+        if self.profile["blocked_urls"].search(url):
+            return "analytics"
+        if self.profile["block_third_party"] and self._third_party(urlparse(url).hostname or ""):
+            return "third-party"
+        return None
+
+    def _handle(self, route: Route, request: Request):
+        reason = self.block_reason(request)
+        if reason:
+            self.blocked[reason] += 1
+            route.abort("blockedbyclient")
+        else:
+            self.allowed += 1
+            route.continue_()
+
+    def _on_response(self, response: Response):
+        # Provisional headers are local: no extra round trip per response
+        length = response.headers.get("content-length")
+        if length and length.isdigit():
+            self.loaded_bytes += int(length)
+
+
+# =================================================
+# OUTPUT – BLOCKING SUMMARY
+# =================================================
+def blocking_summary() -> list[str]:
+    lines = []
+    for b in _BLOCKERS:
+        blocked = sum(b.blocked.values())
+        detail = ", ".join(f"{reason}={count}" for reason, count in b.blocked.most_common())
+        lines.append(
+            f"{b.instance_key:<12} profile={b.profile_name:<8} "
+            f"requests saved={blocked} ({detail or 'none'}) "
+            f"requests loaded={b.allowed} "
+            f"bytes loaded={b.loaded_bytes}"
+        )
+    return lines
@@ -0,0 +1,186 @@
+import glob
+import json
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from helpers.jira_client import get_jira_client
+
+MANIFEST_DIR = "manifests/form_submission"
+DEFAULT_CLEANUP_CONCURRENCY = 8
+WORKER_SUFFIX_REGEX = r"_gw\d+$"
+
+
+def run_prefix(path: str) -> str:
+    return re.sub(WORKER_SUFFIX_REGEX, "", os.path.splitext(os.path.basename(path))[0])
+
+
+# =================================================
+# RUN MANIFEST (APPEND-ONLY JSONL)
+# =================================================
+class SubmissionManifest:
+    """
+    One JSON line per event, flushed to disk immediately so the manifest
+    survives a crash mid-run:
+
+      {"event": "created", "instance": ..., "issueKey": ..., "request": ...}
+      {"event": "cleaned", "instance": ..., "issueKey": ..., "action": ...}
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_new_run(cls) -> "SubmissionManifest":
+        # One manifest per pytest-xdist worker: each cleans up its own issues.
+        # The workers share the xdist run UID so latest_run() finds them all.
+        worker = os.environ.get("PYTEST_XDIST_WORKER")
+        if worker:
+            name = f"form_submission_{os.environ.get('PYTEST_XDIST_TESTRUNUID', '')}_{worker}"
+        else:
+            name = f"form_submission_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        return cls(os.path.join(MANIFEST_DIR, name + ".jsonl"))
+
+    @classmethod
+    def latest_run(cls) -> list["SubmissionManifest"]:
+        """
+        Every manifest of the most recently written run: the per-worker
+        files of an xdist run share their name up to the _gw<N> suffix.
+        """
+        paths = glob.glob(os.path.join(MANIFEST_DIR, "*.jsonl"))
+        if not paths:
+            return []
+
+        run = run_prefix(max(paths, key=os.path.getmtime))
+        return [cls(p) for p in sorted(paths) if run_prefix(p) == run]
+
+    def _append(self, record: dict):
+        with self._lock:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+    def record_created(self, instance_key: str, issue_key: str, request_name: str):
+        self._append({
+            "event": "created",
+            "instance": instance_key,
+            "issueKey": issue_key,
+            "request": request_name,
+        })
+
+    def record_cleaned(self, instance_key: str, issue_key: str, action: str):
+        self._append({
+            "event": "cleaned",
+            "instance": instance_key,
+            "issueKey": issue_key,
+            "action": action,
+        })
+
+    def pending(self) -> list[tuple[str, str]]:
+        """
+        (instance, issueKey) pairs created but not yet cleaned up.
+        """
+        created = {}
+        cleaned = set()
+
+        if not os.path.exists(self.path):
+            return []
+
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                pair = (record["instance"], record["issueKey"])
+                if record["event"] == "created":
+                    created[pair] = True
+                elif record["event"] == "cleaned":
+                    cleaned.add(pair)
+
+        return [pair for pair in created if pair not in cleaned]
+
+
+# =================================================
+# CLEANUP (BOUNDED CONCURRENCY)
+# =================================================
+def delete_issue(instance_key: str, issue_key: str) -> str:
+    resp = get_jira_client(instance_key).delete(
+        f"/rest/api/3/issue/{issue_key}",
+        params={"deleteSubtasks": "true"},
+    )
+    if resp.status_code in (204, 404):
+        return "deleted" if resp.status_code == 204 else "already deleted"
+    raise RuntimeError(f"Delete failed (status={resp.status_code}): {resp.text}")
+
+
+def resolve_issue(instance_key: str, issue_key: str) -> str:
+    client = get_jira_client(instance_key)
+
+    data = client.get_json(f"/rest/api/3/issue/{issue_key}/transitions")
+    done = [
+        t for t in data.get("transitions", [])
+        if t.get("to", {}).get("statusCategory", {}).get("key") == "done"
+    ]
+    if not done:
+        raise RuntimeError("No transition to a done status available")
+
+    resp = client.post(
+        f"/rest/api/3/issue/{issue_key}/transitions",
+        json={"transition": {"id": done[0]["id"]}},
+    )
+    if resp.status_code != 204:
+        raise RuntimeError(f"Transition failed (status={resp.status_code}): {resp.text}")
+    return f"resolved ({done[0]['to'].get('name', '')})"
+
+
+CLEANUP_ACTIONS = {
+    "delete": delete_issue,
+    "resolve": resolve_issue,
+}
+
+
+def cleanup_manifest(
+    manifest: SubmissionManifest,
+    mode: str = "delete",
+    concurrency: int = DEFAULT_CLEANUP_CONCURRENCY,
+) -> dict[str, str]:
+    """
+    Deletes or resolves every pending issue of the manifest and records
+    each success, so re-running after a crash only handles the rest.
+    Returns {issueKey: outcome or "FAILED: reason"}.
+    """
+    action = CLEANUP_ACTIONS[mode]
+    outcomes = {}
+
+    def clean(pair):
+        instance_key, issue_key = pair
+        try:
+            outcome = action(instance_key, issue_key)
+        except Exception as e:
+            return issue_key, f"FAILED: {e}"
+        manifest.record_cleaned(instance_key, issue_key, outcome)
+        return issue_key, outcome
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        for issue_key, outcome in pool.map(clean, manifest.pending()):
+            outcomes[issue_key] = outcome
+
+    return outcomes
+
+
+def print_cleanup_summary(manifest: SubmissionManifest, outcomes: dict[str, str]):
+    print("\n========== CLEANUP SUMMARY ==========")
+    print(f"Manifest : {manifest.path}")
+
+    if not outcomes:
+        print("Nothing to clean up")
+        return
+
+    for issue_key, outcome in outcomes.items():
+        mark = "✖" if outcome.startswith("FAILED") else "✔"
+        print(f"   {mark} {issue_key} : {outcome}")
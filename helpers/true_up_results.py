@@ -0,0 +1,109 @@
+import glob
+import json
+import os
+import zlib
+
+# =================================================
+# SHARDING (STABLE ACROSS PROCESSES AND CI NODES)
+# =================================================
+def parse_shard(value: str) -> tuple[int, int]:
+    """
+    "i/k" -> (i, k) with 1 <= i <= k.
+    """
+    try:
+        index, total = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise ValueError("expected i/k, e.g. 2/4")
+
+    if total < 1 or not 1 <= index <= total:
+        raise ValueError("expected 1 <= i <= k")
+    return index, total
+
+
+def shard_of(key: str, total: int) -> int:
+    """
+    1-based shard owning `key`. crc32 rather than hash(), which is salted
+    per process and would give every node a different split.
+    """
+    return zlib.crc32(key.encode("utf-8")) % total + 1
+
+
+# Merge precedence of the outcomes of one item
+OUTCOME_RANK = {"skipped": 0, "passed": 1, "failed": 2}
+
+
+# =================================================
+# RESULT FILES ({check: {item: outcome}})
+# =================================================
+def write_results_file(path: str, shard: str | None, results: dict[str, dict[str, str]]):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"shard": shard, "results": results}, f, indent=2, sort_keys=True)
+
+
+def merge_results_files(paths: list[str]) -> tuple[dict[str, dict[str, str]], list[str]]:
+    """
+    Combines per-shard result files (files or directories of *.json).
+    The same item from several files keeps its worst outcome
+    (failed > passed > skipped), independent of file order.
+    Returns (results, shards seen).
+    """
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(sorted(glob.glob(os.path.join(path, "*.json"))))
+        else:
+            files.append(path)
+
+    results = {}
+    shards = []
+
+    for path in files:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+
+        if data.get("shard"):
+            shards.append(data["shard"])
+
+        for check, items in data["results"].items():
+            merged = results.setdefault(check, {})
+            for item, outcome in items.items():
+                if OUTCOME_RANK[outcome] > OUTCOME_RANK.get(merged.get(item), -1):
+                    merged[item] = outcome
+
+    return results, shards
+
+
+def missing_shards(shards: list[str]) -> list[str]:
+    """
+    "i/k" shards absent from `shards` (empty when no sharded file was read).
+    """
+    totals = {parse_shard(s)[1] for s in shards}
+    seen = {parse_shard(s) for s in shards}
+    return [
+        f"{i}/{k}"
+        for k in sorted(totals)
+        for i in range(1, k + 1)
+        if (i, k) not in seen
+    ]
+
+
+# =================================================
+# OUTPUT – MATCH / MISMATCH VERDICTS
+# =================================================
+def summary_lines(results: dict[str, dict[str, str]]) -> list[str]:
+    lines = []
+
+    for check, items in sorted(results.items()):
+        failed = sorted(i for i, outcome in items.items() if outcome == "failed")
+        skipped = sum(outcome == "skipped" for outcome in items.values())
+        verdict = "Mismatch" if failed else "Match"
+
+        lines.append(
+            f"{check:<28} {verdict:<8} checked={len(items)} "
+            f"failed={len(failed)} skipped={skipped}"
+        )
+        for item in failed:
+            lines.append(f"    ❌ {item}")
+
+    return lines
@@ -0,0 +1,106 @@
+NO_SCREEN = "No Screen"
+ARROW = "→"
+
+# (from status, transition name, screen name, to status)
+Transition = tuple[str, str, str, str]
+
+
+# =================================================
+# "VIEW AS TEXT" PARSER (ORDER-INDEPENDENT)
+# =================================================
+def parse_workflow_transitions(text: str) -> set[Transition]:
+    """
+    Reads the project workflow "View as text" dialog, where every status
+    line is followed by its outgoing transitions:
+
+      Open
+      Start Progress
+      No Screen
+      → In Progress
+
+    A line is a transition when an "→ <to status>" line follows it,
+    optionally after one screen line. Screen lines are recognised by
+    "Screen" in their name. A screen named otherwise ("Resolve Issue Form")
+    cannot be told apart from a transition: its transition name is read as
+    a status and the screen as the transition, on both instances alike
+    (tests/test_workflow_transitions.py pins this down).
+    """
+    transitions = set()
+    lines = [l.strip() for l in text.splitlines() if l.strip()]
+
+    current_from = None
+    i = 0
+
+    while i < len(lines):
+        line = lines[i]
+        following = lines[i + 1:i + 3]
+
+        if line.startswith(ARROW):
+            i += 1
+            continue
+
+        if following and following[0].startswith(ARROW):
+            to_status = following[0].replace(ARROW, "").strip()
+            transitions.add((current_from, line, NO_SCREEN, to_status))
+            i += 2
+            continue
+
+        if len(following) == 2 and "Screen" in following[0] and following[1].startswith(ARROW):
+            to_status = following[1].replace(ARROW, "").strip()
+            transitions.add((current_from, line, following[0], to_status))
+            i += 3
+            continue
+
+        current_from = line
+        i += 1
+
+    return transitions
+
+
+# =================================================
+# WORKFLOWS API (/rest/api/3/workflows/search)
+# =================================================
+def transition_screen_id(transition: dict) -> str | None:
+    screen = transition.get("transitionScreen") or {}
+    screen_id = (screen.get("parameters") or {}).get("screenId")
+    return str(screen_id) if screen_id else None
+
+
+def build_workflow_transitions(
+    workflow: dict,
+    status_names: dict[str, str],
+    screen_names: dict[str, str],
+) -> set[Transition]:
+    """
+    Produces the same (from, transition, screen, to) tuples that
+    parse_workflow_transitions() builds from the "View as text" dialog.
+    Global transitions are listed under every status of the workflow;
+    the INITIAL (create) transition has no source status and is skipped.
+    """
+    transitions = set()
+    workflow_statuses = [
+        status_names.get(s["statusReference"], s["statusReference"])
+        for s in workflow.get("statuses", [])
+    ]
+
+    for t in workflow.get("transitions", []):
+        if t.get("type") == "INITIAL":
+            continue
+
+        to_status = status_names.get(t.get("toStatusReference"), t.get("toStatusReference"))
+        screen_id = transition_screen_id(t)
+        screen = screen_names.get(screen_id, NO_SCREEN) if screen_id else NO_SCREEN
+
+        if t.get("type") == "GLOBAL":
+            from_statuses = workflow_statuses
+        else:
+            from_statuses = [
+                status_names.get(link["fromStatusReference"], link["fromStatusReference"])
+                for link in t.get("links", [])
+                if link.get("fromStatusReference")
+            ]
+
+        for from_status in from_statuses:
+            transitions.add((from_status, t.get("name", ""), screen, to_status))
+
+    return transitions
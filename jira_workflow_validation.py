@@ -1,6 +1,17 @@
+import functools
+
+import pytest
 from playwright.sync_api import Page
 from config.config import CONFIG
+from helpers.jira_client import JiraClient, get_jira_client
+from helpers.form_readiness import wait_for_locator_hidden, wait_for_selector_ready
 from helpers.logger_helper import get_logger
+from helpers.request_type_inventory import parametrize_from_inventory
+from helpers.workflow_transitions import (
+    build_workflow_transitions,
+    parse_workflow_transitions,
+    transition_screen_id,
+)
 
 logger = get_logger(
     name="workflow_logger",
@@ -8,6 +19,9 @@ logger = get_logger(
     filename_prefix="workflow_validation",
 )
 
+# Name of this check in the aggregated true-up summary (see conftest)
+TRUE_UP_CHECK = "workflows"
+
 
 # =====================================================
 # NORMALIZATION
@@ -36,22 +50,32 @@ def print_section(title: str):
 # =====================================================
 # UI SCRAPER – WORKFLOWS (POC STYLE)
 # =====================================================
+# Returns [[workflow name, [issue type, ...]], ...] for every row in one call
+WORKFLOW_ROWS_SCRIPT = """
+() => Array.from(document.querySelectorAll("tr")).flatMap((row) => {
+    const nameNode = row.querySelector("h3.project-config-workflow-name");
+    if (!nameNode) return [];
+
+    const issueTypes = Array.from(
+        row.querySelectorAll("span.project-config-issuetype-name")
+    ).map((span) => (span.innerText || "").trim());
+
+    return [[(nameNode.innerText || "").trim(), issueTypes]];
+})
+"""
+
+
 def collect_workflows_from_ui(page: Page) -> dict[str, list[str]]:
     workflows = {}
 
-    for row in page.locator("tr").all():
-        name_node = row.locator("h3.project-config-workflow-name")
-        if name_node.count() == 0:
-            continue
-
-        workflow_name = name_node.first.inner_text().strip()
+    for workflow_name, issue_type_texts in page.evaluate(WORKFLOW_ROWS_SCRIPT):
         if not workflow_name.startswith("SUP:"):
             continue
 
         issue_types = {
-            clean_issue_type(span.inner_text().strip())
-            for span in row.locator("span.project-config-issuetype-name").all()
-            if span.inner_text().strip()
+            clean_issue_type(text)
+            for text in issue_type_texts
+            if text
         }
 
         workflows[workflow_name] = sorted(issue_types)
@@ -108,59 +132,141 @@ def collect_workflow_texts(page: Page) -> dict[str, str]:
         )
 
         page.keyboard.press("Escape")
-        page.wait_for_timeout(500)
+        wait_for_locator_hidden(
+            page.locator("div[role='dialog']").first, "workflow text dialog closed"
+        )
 
     return results
 
 
 # =====================================================
-# TRANSITION PARSER (ORDER-INDEPENDENT)
+# REST – WORKFLOW TRANSITIONS
 # =====================================================
-def parse_workflow_transitions(text: str) -> set[tuple[str, str, str, str]]:
-    transitions = set()
-    lines = [l.strip() for l in text.splitlines() if l.strip()]
+def fetch_workflows_rest(client: JiraClient) -> tuple[list[dict], dict[str, str]]:
+    """
+    Bulk-fetches SUP: workflows with their statuses and transitions.
+    Returns (workflows, {statusReference: status name}).
+    """
+    workflows = []
+    status_names = {}
+    start_at = 0
+    max_results = 50
+
+    while True:
+        data = client.get_json(
+            "/rest/api/3/workflows/search",
+            params={
+                "startAt": start_at,
+                "maxResults": max_results,
+                "queryString": "SUP:",
+                "expand": "values.transitions",
+            },
+        )
+        values = data.get("values", [])
 
-    current_from = None
-    i = 0
+        for status in data.get("statuses", []):
+            status_names[status["statusReference"]] = status.get("name", "")
 
-    while i < len(lines):
-        line = lines[i]
+        if not values:
+            break
 
-        if "→" not in line and not line.startswith("No Screen") and not line.startswith("JIRA"):
-            current_from = line
-            i += 1
-            continue
+        workflows.extend(values)
+        start_at += max_results
+        if data.get("isLast") or start_at >= data.get("total", 0):
+            break
 
-        transition = line
-        screen = "No Screen"
+    return workflows, status_names
 
-        if i + 1 < len(lines) and "Screen" in lines[i + 1]:
-            screen = lines[i + 1]
-            i += 1
 
-        if i + 1 < len(lines) and lines[i + 1].startswith("→"):
-            to_status = lines[i + 1].replace("→", "").strip()
-            transitions.add((current_from, transition, screen, to_status))
-            i += 2
-            continue
+@functools.lru_cache(maxsize=None)
+def fetch_workflows_cached(instance_key: str) -> tuple[list[dict], dict[str, str]]:
+    """
+    fetch_workflows_rest() once per process: the same response drives the
+    per-workflow test items at collection time and the transition check.
+    """
+    return fetch_workflows_rest(get_jira_client(instance_key))
+
+
+def fetch_screen_names(client: JiraClient, screen_ids: set[str]) -> dict[str, str]:
+    names = {}
+    ids = sorted(screen_ids)
+
+    for i in range(0, len(ids), 50):
+        data = client.get_json(
+            "/rest/api/3/screens",
+            params=[("id", sid) for sid in ids[i:i + 50]] + [("maxResults", 50)],
+        )
+
+        for screen in data.get("values", []):
+            names[str(screen["id"])] = screen.get("name", "")
+
+    return names
+
 
-        i += 1
+def collect_workflow_transitions_rest(instance_key, workflow_names) -> dict[str, set[tuple[str, str, str, str]]]:
+    client = get_jira_client(instance_key)
 
-    return transitions
+    workflows, status_names = fetch_workflows_cached(instance_key)
+    workflows = [wf for wf in workflows if wf.get("name") in workflow_names]
+
+    screen_ids = {
+        sid
+        for wf in workflows
+        for t in wf.get("transitions", [])
+        if (sid := transition_screen_id(t))
+    }
+    screen_names = fetch_screen_names(client, screen_ids) if screen_ids else {}
+
+    return {
+        wf["name"]: build_workflow_transitions(wf, status_names, screen_names)
+        for wf in workflows
+    }
+
+
+def collect_workflow_transitions_ui(page: Page) -> dict[str, set[tuple[str, str, str, str]]]:
+    return {
+        name: parse_workflow_transitions(text)
+        for name, text in collect_workflow_texts(page).items()
+        if text
+    }
 
 
 # =====================================================
-# MAIN TEST
+# ONE TEST ITEM PER WORKFLOW (XDIST CAN DISTRIBUTE THEM)
 # =====================================================
-def test_workflow_validation(contexts):
-    instance_results = {}
+def workflow_keys() -> list[str]:
+    """
+    Sorted normalized names of the SUP: workflows of every instance.
+    """
+    return sorted({
+        normalize_workflow_name(wf["name"])
+        for instance_key in CONFIG
+        for wf in fetch_workflows_cached(instance_key)[0]
+        if wf.get("name", "").startswith("SUP:")
+    })
 
-    scheme_failed = False
-    workflow_failed = False
-    issuetype_failed = False
-    transition_failed = False
 
-    # ---------- COLLECT ----------
+# Single item when the workflows are only known from the browser
+ALL_WORKFLOWS = "all workflows"
+
+
+def pytest_generate_tests(metafunc):
+    if "workflow" not in metafunc.fixturenames:
+        return
+
+    if metafunc.config.getoption("--workflow-source") == "ui":
+        metafunc.parametrize("workflow", [ALL_WORKFLOWS])
+    else:
+        parametrize_from_inventory(metafunc, "workflow", workflow_keys)
+
+
+# =====================================================
+# COLLECT (ONCE PER MODULE)
+# =====================================================
+@pytest.fixture(scope="module")
+def workflow_snapshot(contexts, workflow_source):
+    instance_results = {}
+
     for instance_key, context in contexts.items():
         cfg = CONFIG[instance_key]
         page = context.new_page()
@@ -169,151 +275,180 @@ def test_workflow_validation(contexts):
             cfg["base_url"] + cfg["workflow_settings_url"],
             wait_until="domcontentloaded"
         )
-        page.wait_for_timeout(3000)
+        wait_for_selector_ready(
+            page,
+            "h2.project-config-workflows-scheme-name, h3.project-config-workflow-name",
+            "workflow settings rendered",
+        )
+
+        workflows = collect_workflows_from_ui(page)
+
+        if workflow_source == "ui":
+            transitions = collect_workflow_transitions_ui(page)
+        else:
+            transitions = collect_workflow_transitions_rest(instance_key, set(workflows))
 
         instance_results[instance_key] = {
             "scheme": get_workflow_scheme_name(page),
-            "workflows": collect_workflows_from_ui(page),
-            "texts": collect_workflow_texts(page),
+            "workflows": workflows,
+            "norm_workflows": {normalize_workflow_name(k): k for k in workflows},
+            "transitions": {normalize_workflow_name(k): v for k, v in transitions.items()},
         }
 
         page.close()
 
-    inst1, inst2 = list(instance_results.keys())
+    # =================================================
+    # RAW VIEW (command this if you dont what raw view summary )
+    # =================================================
+    print_section("JIRA WORKFLOWS (RAW VIEW)")
+    for instance_key, result in instance_results.items():
+        print_workflow_summary(instance_key, result["workflows"])
 
-    scheme1 = instance_results[inst1]["scheme"]
-    scheme2 = instance_results[inst2]["scheme"]
+    return instance_results
 
-    w1 = instance_results[inst1]["workflows"]
-    w2 = instance_results[inst2]["workflows"]
 
-    t1 = instance_results[inst1]["texts"]
-    t2 = instance_results[inst2]["texts"]
+def print_transitions(title: str, transitions: set[tuple[str, str, str, str]]):
+    print(f"   {title}")
+    for f, t, screen, to in sorted(transitions):
+        print(f"      FROM [{f}]")
+        print(f"        TRANSITION : {t}")
+        print(f"        SCREEN     : {screen}")
+        print(f"        TO         : {to}")
 
-    norm_w1 = {normalize_workflow_name(k): k for k in w1}
-    norm_w2 = {normalize_workflow_name(k): k for k in w2}
 
-    # =================================================
-    # PHASE 1: RAW VIEW (command this if you dont what raw view summary )
-    # =================================================
-    
-    print_section("JIRA WORKFLOWS (RAW VIEW)")
-    print_workflow_summary(inst1, w1)
-    print_workflow_summary(inst2, w2)
+# =====================================================
+# TEST – WORKFLOW SCHEME
+# =====================================================
+def test_workflow_scheme(workflow_snapshot):
+    inst1, inst2 = list(workflow_snapshot.keys())
+
+    scheme1 = workflow_snapshot[inst1]["scheme"]
+    scheme2 = workflow_snapshot[inst2]["scheme"]
 
-    # =================================================
-    # PHASE 2: WORKFLOW SCHEME
-    # =================================================
     print_section("WORKFLOW SCHEME COMPARISON")
     print(f"{inst1}: {scheme1}")
     print(f"{inst2}: {scheme2}")
 
     if scheme1 != scheme2:
         print("❌ Workflow scheme mismatch")
-        scheme_failed = True
     else:
         print("✅ Workflow schemes match")
 
+    assert scheme1 == scheme2, "Workflow scheme validation failed"
+
+
+# =====================================================
+# COMPARE – ONE WORKFLOW
+# =====================================================
+def compare_workflow(workflow_snapshot: dict, workflow: str) -> set[str] | None:
+    """
+    Prints the comparison of one normalized workflow and returns the failed
+    aspects ("workflow", "issue types", "transitions"); None when neither
+    instance's workflow scheme uses it.
+    """
+    failed = set()
+
+    inst1, inst2 = list(workflow_snapshot.keys())
+
+    w1 = workflow_snapshot[inst1]["workflows"]
+    w2 = workflow_snapshot[inst2]["workflows"]
+
+    wf1 = workflow_snapshot[inst1]["norm_workflows"].get(workflow)
+    wf2 = workflow_snapshot[inst2]["norm_workflows"].get(workflow)
+
+    # The REST inventory also lists SUP: workflows that no project uses;
+    # the UI check only covers the workflow scheme
+    if not wf1 and not wf2:
+        return None
+
+    print_section(f"WORKFLOW: {wf1 or wf2}")
+
     # =================================================
-    # PHASE 3: WORKFLOWS
+    # WORKFLOW NAME
     # =================================================
-    print_section("WORKFLOWS COMPARISON")
-
-    for key in sorted(set(norm_w1) | set(norm_w2)):
-        wf1 = norm_w1.get(key)
-        wf2 = norm_w2.get(key)
-
-        if wf1 and wf2:
-            if wf1 == wf2:
-                print(f"✅ {wf1}")
-            else:
-                print(f"❌ RENAMED {wf1} → {wf2}")
-                workflow_failed = True
-        elif wf1:
-            print(f"❌ REMOVED {wf1}")
-            workflow_failed = True
+    if wf1 and wf2:
+        if wf1 == wf2:
+            print(f"✅ {wf1}")
         else:
-            print(f"❌ ADDED {wf2}")
-            workflow_failed = True
+            print(f"❌ RENAMED {wf1} → {wf2}")
+            failed.add("workflow")
+    elif wf1:
+        print(f"❌ REMOVED {wf1}")
+        failed.add("workflow")
+    else:
+        print(f"❌ ADDED {wf2}")
+        failed.add("workflow")
 
     # =================================================
-    # PHASE 4: ISSUE TYPES
+    # ISSUE TYPES
     # =================================================
-    print_section("ISSUE TYPES COMPARISON (PER WORKFLOW)")
-
-    for key in sorted(set(norm_w1) | set(norm_w2)):
-        wf1 = norm_w1.get(key)
-        wf2 = norm_w2.get(key)
-
-        it1 = set(w1.get(wf1, [])) if wf1 else set()
-        it2 = set(w2.get(wf2, [])) if wf2 else set()
-
-        print(f"🔹 {wf1 or wf2}")
-        print(f"   {inst1}: {', '.join(sorted(it1)) if it1 else '(none)'}")
-        print(f"   {inst2}: {', '.join(sorted(it2)) if it2 else '(none)'}")
+    it1 = set(w1.get(wf1, [])) if wf1 else set()
+    it2 = set(w2.get(wf2, [])) if wf2 else set()
 
-        if it1 != it2:
-            print("   ❌ Issue type mismatch")
-            issuetype_failed = True
-        else:
-            print("   ✅ Issue types match")
+    print(f"   {inst1}: {', '.join(sorted(it1)) if it1 else '(none)'}")
+    print(f"   {inst2}: {', '.join(sorted(it2)) if it2 else '(none)'}")
 
-        print()
+    if it1 != it2:
+        print("   ❌ Issue type mismatch")
+        failed.add("issue types")
+    else:
+        print("   ✅ Issue types match")
 
     # =================================================
-    # PHASE 5: TRANSITIONS 
+    # TRANSITIONS
     # =================================================
-    print_section("WORKFLOW TRANSITION TEXT COMPARISON")
+    s1 = workflow_snapshot[inst1]["transitions"].get(workflow)
+    s2 = workflow_snapshot[inst2]["transitions"].get(workflow)
+
+    if s1 is None and s2 is None:
+        pass
+    elif s1 is None or s2 is None:
+        print("   ❌ Workflow transitions missing in one instance")
+        failed.add("transitions")
+    elif s1 == s2:
+        print("   ✅ Workflow transitions are semantically identical")
+    else:
+        failed.add("transitions")
+        print("   ❌ Workflow transition mismatch detected")
 
-    norm_t1 = {normalize_workflow_name(k): v for k, v in t1.items()}
-    norm_t2 = {normalize_workflow_name(k): v for k, v in t2.items()}
+        if s1 - s2:
+            print_transitions(f"➖ Missing in {inst2}:", s1 - s2)
+        if s2 - s1:
+            print_transitions(f"➕ Extra in {inst2}:", s2 - s1)
 
-    for wf in sorted(set(norm_t1) | set(norm_t2)):
-        print(f"🔹 {wf}")
+    print()
 
-        raw1 = norm_t1.get(wf)
-        raw2 = norm_t2.get(wf)
+    return failed
 
-        if not raw1 or not raw2:
-            print("   ❌ Workflow text missing in one instance")
-            transition_failed = True
-            continue
 
-        s1 = parse_workflow_transitions(raw1)
-        s2 = parse_workflow_transitions(raw2)
+# =====================================================
+# TEST – ONE WORKFLOW (OR ALL WITH --workflow-source ui)
+# =====================================================
+def test_workflow_validation(workflow_snapshot, workflow):
+    if workflow == ALL_WORKFLOWS:
+        workflows = sorted({
+            key
+            for result in workflow_snapshot.values()
+            for key in result["norm_workflows"]
+        })
+    else:
+        workflows = [workflow]
 
-        if s1 == s2:
-            print("   ✅ Workflow transitions are semantically identical")
+    failed = set()
+    checked = 0
+    for key in workflows:
+        result = compare_workflow(workflow_snapshot, key)
+        if result is None:
             continue
+        checked += 1
+        failed |= result
 
-        transition_failed = True
-        print("   ❌ Workflow transition mismatch detected")
-
-        missing = s1 - s2
-        extra = s2 - s1
-
-        if missing:
-            print("   ➖ Missing in INSTANCE_2:")
-            for f, t, screen, to in sorted(missing):
-                print(f"      FROM [{f}]")
-                print(f"        TRANSITION : {t}")
-                print(f"        SCREEN     : {screen}")
-                print(f"        TO         : {to}")
-
-        if extra:
-            print("   ➕ Extra in INSTANCE_2:")
-            for f, t, screen, to in sorted(extra):
-                print(f"      FROM [{f}]")
-                print(f"        TRANSITION : {t}")
-                print(f"        SCREEN     : {screen}")
-                print(f"        TO         : {to}")
-
-        print()
+    if not checked:
+        pytest.skip(f"{workflow} is not used by the workflow scheme of either instance")
 
     # =================================================
     # FINAL ASSERTIONS
     # =================================================
-    assert not scheme_failed, "Workflow scheme validation failed"
-    assert not workflow_failed, "Workflow validation failed"
-    assert not issuetype_failed, "Issue type validation failed"
-    assert not transition_failed, "Transition validation failed"
+    assert "workflow" not in failed, "Workflow validation failed"
+    assert "issue types" not in failed, "Issue type validation failed"
+    assert "transitions" not in failed, "Transition validation failed"
@@ -1,5 +1,7 @@
+import glob
 import sys
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 
 # =====================================================
 # MODULE GROUPS
@@ -12,12 +14,9 @@ NON_GLOBAL_MODULES = [
     "jira_workflow_validation",
 ]
 
-GLOBAL_MODULES = [
-    "global_custom_jira_field_validation",
-    "global_workflow_validation",
-    "global_workflow_scheme_validation",
-    "global_status_validation",
-]
+# Scans every object type of the global_* modules (plus screens, issue
+# types and resolutions) concurrently in one process: used by run_all_global
+GLOBAL_SCANNER_MODULE = "global_migrated_artifact_validation"
 
 # =====================================================
 # HELP
@@ -52,6 +51,8 @@ Modules:
 
   global_status_validation              Validate migrated statuses 
 
+  global_migrated_artifact_validation   Validate all migrated global objects in one pass
+
 Login Scripts (Run directly):
 
   python login/instance_1_login.py   Login to Instance 1 and generate session data
@@ -62,8 +63,52 @@ Use "python post_true_up_process.py <module> -h" for more help on a module.
 
 Use "python post_true_up_process.py run_all" for space level validation
 
+Use "python post_true_up_process.py cleanup_form_submission [--manifest PATH|GLOB] [--mode delete|resolve] [--jobs N]"
+to delete/resolve the issues created by request_type_form_submission (re-runnable)
+
+Use "python post_true_up_process.py merge <results dir or files...>" to combine the
+result files of sharded runs (--shard i/k --results-dir DIR) into one Match/Mismatch summary
+
 Use "python post_true_up_process.py run_all_global --migrated-date <"DD Mon YYYY">" for global level validation
 
+Options for run_all / run_all_global:
+
+  --jobs N          (run_all only) Run up to N modules in parallel (default: 1).
+                    Output of each module is captured and printed in module order.
+                    run_all_global runs one module that already scans all object
+                    types concurrently.
+
+  --single-session  (run_all only) Run all modules in one in-process pytest
+                    session sharing a single browser and its contexts.
+
+  --inventory-ttl S Keep each portal's request type list on disk for S seconds
+                    and reuse it across runs (default: 0, memory only)
+
+  --refresh         Ignore the on-disk portal inventory and scrape the portals again
+
+  --block-profile P none (default) | scrape: abort images, fonts, media, analytics
+                    and third-party hosts in the browser; the blocked/loaded
+                    request counts are printed at the end of the run
+
+  -n N              (pytest-xdist) Spread the per-form / per-workflow test items
+                    over N worker processes, each with its own browser; the
+                    aggregated true-up summary is printed at the end
+
+  --shard i/k       Only run slice i of k: request types, workflows and the other
+                    tests are assigned by a stable hash, so every CI node gets
+                    the same split
+
+  --results-dir DIR Write this run's results to a JSON file in DIR, one file per
+                    shard and module set, for the merge subcommand
+
+  --run-id ID       Checkpoint ID of the form crawl (default: a new ID shared by
+                    all modules of the run); each extracted form is saved as soon
+                    as it is done. Checkpoints older than 7 days are deleted.
+
+  --resume          Skip the forms already extracted by --run-id, or by the most
+                    recent checkpoint (if written in the last 24h) when no
+                    --run-id is given
+
 """
  
 MODULE_HELP = {
@@ -79,7 +124,11 @@ Usage:
  
 Arguments:
 
-(No arguments required)
+  --link-concurrency N   Links checked in parallel (default: 16)
+
+  --link-per-host N      Concurrent checks against one host (default: 8)
+
+  --link-method M        head (default): HEAD first with GET fallback | get: always GET
 
 """,
 
@@ -120,11 +169,16 @@ request_type_form_submission.py - Validate the Form Submission (Success/Failure)
  
 Usage:
 
-  python post_true_up_process.py request_type_form_submission
+  python post_true_up_process.py request_type_form_submission [--submit-concurrency N]
  
 Arguments:
 
-(No arguments required)
+  --submit-concurrency   Number of request types submitted in parallel (default: 4)
+
+  --no-payload-cache     Rediscover request type fields instead of submitting
+                         cached payload templates directly
+
+  --cleanup MODE         none (default) | delete | resolve the created issues after the run
 
 """,
 
@@ -135,11 +189,12 @@ jira_workflow_validation.py - Validate the Workflow (Functional/Broken)
  
 Usage:
 
-  python post_true_up_process.py jira_workflow_validation
+  python post_true_up_process.py jira_workflow_validation [--workflow-source rest|ui]
  
 Arguments:
 
-(No arguments required)
+  --workflow-source   rest (default): compare transitions from the Jira workflows API
+                      ui: scrape the "View as text" dialog of every workflow
 
 """,
 
@@ -154,7 +209,11 @@ Usage:
 
 Arguments:
 
-  --migrated-date   Filter by migration date
+  --migrated-date   Filter by migration date: one date, a comma separated list
+                    or a range "16 Jan 2026..18 Jan 2026" (one fetch, per-date buckets)
+
+  --full-scan       Download every object instead of pre-filtering names
+                    containing "migrated" on the server
 
 """,
 
@@ -169,7 +228,11 @@ Usage:
 
 Arguments:
 
-  --migrated-date   Filter by migration date
+  --migrated-date   Filter by migration date: one date, a comma separated list
+                    or a range "16 Jan 2026..18 Jan 2026" (one fetch, per-date buckets)
+
+  --full-scan       Download every object instead of pre-filtering names
+                    containing "migrated" on the server
 
 """,
 
@@ -184,7 +247,8 @@ Usage:
 
 Arguments:
 
-  --migrated-date   Filter by migration date
+  --migrated-date   Filter by migration date: one date, a comma separated list
+                    or a range "16 Jan 2026..18 Jan 2026" (one fetch, per-date buckets)
 
 """,
 
@@ -199,7 +263,33 @@ Usage:
 
 Arguments:
 
-  --migrated-date   Filter by migration date
+  --migrated-date   Filter by migration date: one date, a comma separated list
+                    or a range "16 Jan 2026..18 Jan 2026" (one fetch, per-date buckets)
+
+  --full-scan       Download every object instead of pre-filtering names
+                    containing "migrated" on the server
+
+""",
+
+    'global_migrated_artifact_validation':
+        """
+
+global_migrated_artifact_validation.py - Validate migrated custom fields, statuses, workflows,
+workflow schemes, screens, issue types and resolutions in one pass
+ 
+Usage:
+
+  python post_true_up_process.py global_migrated_artifact_validation --migrated-date "16 Jan 2026"
+
+Arguments:
+
+  --migrated-date     Filter by migration date: one date, a comma separated list
+                      or a range "16 Jan 2026..18 Jan 2026" (one fetch, per-date buckets)
+
+  --global-instance   Instance to scan (repeatable, default: INSTANCE_2)
+
+  --full-scan         Download every object instead of pre-filtering names
+                      containing "migrated" on the server
 
 """,
 
@@ -236,57 +326,254 @@ Purpose:
 """
 }
 
+# =====================================================
+# ARGUMENT HELPERS
+# =====================================================
+def pop_option(argv: list[str], name: str, default=None):
+    """
+    Removes `name VALUE` / `name=VALUE` from argv and returns VALUE.
+    """
+    for i, arg in enumerate(argv):
+        if arg == name:
+            if i + 1 >= len(argv):
+                raise SystemExit(f"\nERROR: {name} requires a value\n")
+            value = argv[i + 1]
+            del argv[i:i + 2]
+            return value
+        if arg.startswith(f"{name}="):
+            del argv[i]
+            return arg.split("=", 1)[1]
+    return default
+
+
+def parse_jobs(argv: list[str], default: int = 1) -> int:
+    value = pop_option(argv, "--jobs", str(default))
+    try:
+        jobs = int(value)
+    except ValueError:
+        raise SystemExit(f"\nERROR: --jobs expects a number, got {value!r}\n")
+    if jobs < 1:
+        raise SystemExit("\nERROR: --jobs must be at least 1\n")
+    return jobs
+
+
+# =====================================================
+# MODULE RUNNERS
+# =====================================================
+def build_pytest_args(module: str, extra_args: list[str]) -> list[str]:
+    return ["pytest", f"{module}.py", "-s", "-v"] + extra_args
+
+
+def run_module(module: str, extra_args: list[str]) -> int:
+    args = build_pytest_args(module, extra_args)
+    print(f"\n▶ Running: {' '.join(args)}\n")
+    return subprocess.run(args).returncode
+
+
+def run_module_captured(module: str, extra_args: list[str]):
+    args = build_pytest_args(module, extra_args)
+    result = subprocess.run(args, capture_output=True, text=True)
+    return args, result
+
+
+def run_single_session(modules: list[str], extra_args: list[str]) -> int:
+    """
+    Collects every module in one in-process pytest session so the browser
+    and the session-scoped `contexts` fixture are created only once.
+    """
+    import pytest
+
+    args = [f"{m}.py" for m in modules] + ["-s", "-v"] + extra_args
+    print(f"\n▶ Running in-process: pytest {' '.join(args)}\n")
+    return int(pytest.main(args))
+
+
+def print_run_summary(return_codes: dict[str, int]):
+    print("\n================ RUN SUMMARY =================\n")
+    for module, code in return_codes.items():
+        verdict = "✅ PASSED" if code == 0 else f"❌ FAILED (exit code {code})"
+        print(f"{module:<40} {verdict}")
+
+
+def run_modules(modules: list[str], extra_args: list[str], jobs: int) -> int:
+    """
+    Runs every module and returns the aggregated exit code
+    (0 only when every module passed, otherwise the highest exit code).
+    """
+    return_codes = {}
+
+    if jobs == 1:
+        for m in modules:
+            return_codes[m] = run_module(m, extra_args)
+    else:
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            futures = {
+                m: pool.submit(run_module_captured, m, extra_args)
+                for m in modules
+            }
+
+            # Output is shown in module order, as soon as each module is done
+            for m, future in futures.items():
+                args, result = future.result()
+                print(f"\n▶ Ran: {' '.join(args)}\n")
+                if result.stdout:
+                    print(result.stdout, end="")
+                if result.stderr:
+                    print(result.stderr, end="", file=sys.stderr)
+                return_codes[m] = result.returncode
+
+    print_run_summary(return_codes)
+    return max(return_codes.values(), default=0)
+
+
+def with_run_id(extra_args: list[str]):
+    """
+    Gives every module of run_all the same crawl checkpoint ID, so their
+    checkpoints land in one run directory and --resume finds them all.
+    """
+    from helpers.crawl_checkpoint import CrawlCheckpoint
+
+    if any(a == "--run-id" or a.startswith("--run-id=") for a in extra_args):
+        return
+
+    run_id = CrawlCheckpoint.latest_run_id() if "--resume" in extra_args else None
+    extra_args += ["--run-id", run_id or CrawlCheckpoint.new_run_id()]
+
+
+# =====================================================
+# CLEANUP OF FORM SUBMISSION ISSUES
+# =====================================================
+def run_cleanup(extra_args: list[str]) -> int:
+    from helpers.submission_manifest import (
+        SubmissionManifest,
+        cleanup_manifest,
+        print_cleanup_summary,
+    )
+
+    path = pop_option(extra_args, "--manifest")
+    mode = pop_option(extra_args, "--mode", "delete")
+    jobs = parse_jobs(extra_args, default=8)
+
+    if mode not in ("delete", "resolve"):
+        print(f"\nERROR: --mode must be delete or resolve, got {mode!r}\n")
+        return 2
+
+    # --manifest accepts a path or a glob (e.g. every worker file of one run)
+    if path:
+        manifests = [SubmissionManifest(p) for p in sorted(glob.glob(path))]
+    else:
+        manifests = SubmissionManifest.latest_run()
+    if not manifests:
+        print("\nERROR: no form submission manifest found\n")
+        return 2
+
+    failed = False
+    for manifest in manifests:
+        outcomes = cleanup_manifest(manifest, mode=mode, concurrency=jobs)
+        print_cleanup_summary(manifest, outcomes)
+        failed |= any(o.startswith("FAILED") for o in outcomes.values())
+
+    return 1 if failed else 0
+
+
+# =====================================================
+# MERGE OF PER-SHARD RESULT FILES
+# =====================================================
+def run_merge(extra_args: list[str]) -> int:
+    from helpers.true_up_results import merge_results_files, missing_shards, summary_lines
+
+    if not extra_args:
+        print("\nERROR: give the result files or directories to merge\n")
+        return 2
+
+    results, shards = merge_results_files(extra_args)
+    if not results:
+        print("\nERROR: no true-up results found in the given files\n")
+        return 2
+
+    print("\n================ TRUE-UP SUMMARY =================\n")
+    print(f"Shards merged : {', '.join(sorted(set(shards))) or '(unsharded)'}")
+    for line in summary_lines(results):
+        print(line)
+
+    missing = missing_shards(shards)
+    if missing:
+        print(f"\n❌ Missing shard results: {', '.join(missing)}")
+        return 2
+
+    failed = any(outcome == "failed" for items in results.values() for outcome in items.values())
+    return 1 if failed else 0
+
+
 # =====================================================
 # MAIN
 # =====================================================
-def main():
+def main() -> int:
     if len(sys.argv) == 1 or sys.argv[1] in ('-h', '--help'):
         print(HELP)
-        return
+        return 0
 
     module = sys.argv[1]
+    extra_args = sys.argv[2:]
 
     # ============================
     # RUN ALL NON-GLOBAL VALIDATIONS
     # ============================
     if module == "run_all":
-        for m in NON_GLOBAL_MODULES:
-            script = f"{m}.py"
-            args = ["pytest", script, "-s", "-v"]
-            print(f"\n▶ Running: {' '.join(args)}\n")
-            subprocess.run(args)
-        return
+        single_session = "--single-session" in extra_args
+        if single_session:
+            extra_args.remove("--single-session")
+
+        jobs = parse_jobs(extra_args)
+        with_run_id(extra_args)
+
+        if single_session:
+            if jobs > 1:
+                print("\nERROR: --single-session cannot be combined with --jobs\n")
+                return 2
+            return run_single_session(NON_GLOBAL_MODULES, extra_args)
+
+        return run_modules(NON_GLOBAL_MODULES, extra_args, jobs)
 
     # ============================
     # RUN ALL GLOBAL VALIDATIONS
     # ============================
     if module == "run_all_global":
-        if "--migrated-date" not in sys.argv:
+        if not any(a.startswith("--migrated-date") for a in extra_args):
             print("\nERROR: --migrated-date \"DD Mon YYYY\" is required\n")
-            return
+            return 2
 
-        for m in GLOBAL_MODULES:
-            script = f"{m}.py"
-            args = ["pytest", script, "-s", "-v"] + sys.argv[2:]
-            print(f"\n▶ Running: {' '.join(args)}\n")
-            subprocess.run(args)
-        return
+        if any(a == "--jobs" or a.startswith("--jobs=") for a in extra_args):
+            print("\nERROR: --jobs is not supported by run_all_global (the scan is already concurrent)\n")
+            return 2
+
+        return run_modules([GLOBAL_SCANNER_MODULE], extra_args, jobs=1)
+
+    # ============================
+    # CLEANUP OF CREATED ISSUES
+    # ============================
+    if module == "cleanup_form_submission":
+        return run_cleanup(extra_args)
+
+    # ============================
+    # MERGE OF SHARD RESULTS
+    # ============================
+    if module == "merge":
+        return run_merge(extra_args)
 
     # ============================
     # SINGLE MODULE EXECUTION
     # ============================
     if module in MODULE_HELP:
-        if len(sys.argv) > 2 and sys.argv[2] in ('-h', '--help'):
+        if extra_args and extra_args[0] in ('-h', '--help'):
             print(MODULE_HELP[module])
-        else:
-            script = f"{module}.py"
-            args = ["pytest", script, "-s", "-v"] + sys.argv[2:]
-            print(f"\n▶ Running: {' '.join(args)}\n")
-            subprocess.run(args)
-    else:
-        print(f"Unknown module: {module}")
-        print(HELP)
+            return 0
+        return run_module(module, extra_args)
+
+    print(f"Unknown module: {module}")
+    print(HELP)
+    return 2
 
 # =====================================================
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -1,10 +1,21 @@
+import os
 import pytest
-import re
-from playwright.sync_api import Page
-from helpers.collect_request_type_links import collect_request_links
+import time
+from concurrent.futures import ThreadPoolExecutor
 from helpers.jira_form_submission import create_request
+from helpers.payload_template_cache import PayloadTemplateCache
+from helpers.submission_manifest import (
+    SubmissionManifest,
+    cleanup_manifest,
+    print_cleanup_summary,
+)
 from config.config import CONFIG
 from helpers.logger_helper import get_logger
+from helpers.request_type_inventory import (
+    get_service_desk_id_from_portal,
+    parametrize_from_inventory,
+    request_type_ids,
+)
 
 logger = get_logger(
     name="form_submission_logger",
@@ -12,80 +23,185 @@ logger = get_logger(
     filename_prefix="form_submission",
 )
 
-
-INSTANCE_KEY = "INSTANCE_2"
+# Name of this check in the aggregated true-up summary (see conftest)
+TRUE_UP_CHECK = "form submission"
 
 
-def get_service_desk_id_from_portal(portal: str) -> str:
-    m = re.search(r"/portal/(\d+)", portal)
-    if not m:
-        raise RuntimeError(f"Cannot extract serviceDeskId from {portal}")
-    return m.group(1)
+INSTANCE_KEY = "INSTANCE_2"
 
 
-@pytest.mark.e2e
-def test_form_submission_via_rest(contexts):
+# Body paths print_submission() reads from a created request
+CREATED_BODY_KEYS = [
+    ("issueKey",),
+    ("summary",),
+    ("currentStatus", "status"),
+    ("_links", "web"),
+]
+
+
+def check_created_body(body) -> None:
+    missing = []
+    for path in CREATED_BODY_KEYS:
+        node = body
+        for key in path:
+            node = node.get(key) if isinstance(node, dict) else None
+        if node is None:
+            missing.append(".".join(path))
+
+    if missing:
+        raise RuntimeError(f"Unexpected create response, missing: {', '.join(missing)}")
+
+
+# =====================================================
+# SUBMISSION (ONE REQUEST TYPE)
+# =====================================================
+def submit_request_type(
+    service_desk_id: str,
+    req_name: str,
+    request_type_id: str,
+    template_cache: PayloadTemplateCache | None = None,
+    manifest: SubmissionManifest | None = None,
+) -> dict:
+    started = time.perf_counter()
+
+    try:
+        result = create_request(
+            instance_key=INSTANCE_KEY,
+            service_desk_id=service_desk_id,
+            request_type_id=request_type_id,
+            request_type_name=req_name,
+            template_cache=template_cache,
+        )
+        issue_key = result["body"].get("issueKey") if isinstance(result["body"], dict) else None
+        # Recorded before validating, so cleanup still finds the issue
+        if manifest and issue_key:
+            manifest.record_created(INSTANCE_KEY, issue_key, req_name)
+        check_created_body(result["body"])
+        outcome = {"request": req_name, "result": result}
+    except Exception as e:
+        outcome = {"request": req_name, "error": str(e)}
+
+    outcome["latency"] = time.perf_counter() - started
+    return outcome
+
+
+def print_submission(outcome: dict):
+    print(f"\n→ Submitting: {outcome['request']}")
+
+    if "error" in outcome:
+        print(f"   ✖ FAILED : {outcome['request']}")
+        print(f"     Reason : {outcome['error']}")
+        print(f"     Latency: {outcome['latency']:.2f}s")
+        return
+
+    result = outcome["result"]
+    data = result["body"]
+
+    print(f"   ✔ HTTP Code : {result['status_code']}")
+    print(f"   ✔ Issue Key : {data['issueKey']}")
+    print(f"   ✔ Summary   : {data['summary']}")
+    print(f"   ✔ Status    : {data['currentStatus']['status']}")
+    print(f"   ✔ Link      : {data['_links']['web']}")
+    print(f"   ✔ Latency   : {outcome['latency']:.2f}s")
+    if result.get("cached"):
+        print("   ✔ Payload   : cached template")
+
+
+# =====================================================
+# SUBMISSIONS SHARED BY THE PER-REQUEST-TYPE ITEMS
+# =====================================================
+@pytest.fixture(scope="module")
+def submissions(
+    submit_concurrency,
+    payload_template_cache,
+    submission_manifest,
+    submission_cleanup,
+    selected_items,
+):
+    """
+    Returns outcome(request type name). Without pytest-xdist the first
+    lookup submits every selected request type through the thread pool; under
+    xdist each worker submits only the request types it was given.
+    Timings and the optional cleanup run once the module has finished.
+    """
     cfg = CONFIG[INSTANCE_KEY]
+    service_desk_id = get_service_desk_id_from_portal(cfg["portal"])
+    request_types = request_type_ids(INSTANCE_KEY)
+    prefetch = "PYTEST_XDIST_WORKER" not in os.environ
+
+    outcomes = {}
+    elapsed = 0.0
+
+    def outcome(req_name: str) -> dict:
+        nonlocal elapsed
+
+        if req_name not in outcomes:
+            if prefetch:
+                batch = [
+                    name for name in request_types
+                    if selected_items is None or name in selected_items
+                ]
+            else:
+                batch = [req_name]
+
+            # CONCURRENT SUBMISSION (field discovery + create per request type)
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=submit_concurrency) as pool:
+                futures = {
+                    name: pool.submit(
+                        submit_request_type,
+                        service_desk_id,
+                        name,
+                        request_types[name],
+                        payload_template_cache,
+                        submission_manifest,
+                    )
+                    for name in batch
+                }
+                for name, future in futures.items():
+                    outcomes[name] = future.result()
+            elapsed += time.perf_counter() - started
+
+        return outcomes[req_name]
+
+    yield outcome
+
+    if outcomes:
+        latencies = [o["latency"] for o in outcomes.values()]
+        print("\n========== SUBMISSION TIMINGS ==========")
+        print(f"Requests    : {len(outcomes)} (concurrency {submit_concurrency})")
+        print(f"Wall time   : {elapsed:.2f}s")
+        print(f"Avg latency : {sum(latencies) / len(latencies):.2f}s")
+        print(f"Max latency : {max(latencies):.2f}s")
+        print(f"Manifest    : {submission_manifest.path}")
+
+    # OPTIONAL CLEANUP OF CREATED ISSUES
+    if submission_cleanup != "none":
+        cleaned = cleanup_manifest(
+            submission_manifest, mode=submission_cleanup, concurrency=submit_concurrency
+        )
+        print_cleanup_summary(submission_manifest, cleaned)
+
+        failed = [key for key, outcome in cleaned.items() if outcome.startswith("FAILED")]
+        if failed:
+            pytest.fail(f"Cleanup failed for {len(failed)} issue(s): {', '.join(failed)}")
+
+
+# =====================================================
+# ONE TEST ITEM PER REQUEST TYPE (XDIST CAN DISTRIBUTE THEM)
+# =====================================================
+def pytest_generate_tests(metafunc):
+    if "req_name" in metafunc.fixturenames:
+        parametrize_from_inventory(metafunc, "req_name", lambda: sorted(request_type_ids(INSTANCE_KEY)))
+
+
+# =====================================================
+# TEST
+# =====================================================
+@pytest.mark.e2e
+def test_form_submission_via_rest(submissions, req_name):
+    outcome = submissions(req_name)
+    print_submission(outcome)
 
-    base = cfg["base_url"]
-    portal = cfg["portal"]
-    service_desk_id = get_service_desk_id_from_portal(portal)
-
-    context = contexts[INSTANCE_KEY]
-    page = context.new_page()
-
-    failures = []
-
-    print(f"\n========== INSTANCE: {INSTANCE_KEY} ==========")
-
-    # AUTHENTICATED PAGE
-    page.goto(base + portal, wait_until="domcontentloaded")
-
-    links = collect_request_links(page)
-    print(f"Found {len(links)} forms for submission")
-    assert links, "No request types discovered (likely auth issue)"
-
-    for req_name, href in links.items():
-        request_type_id = href.split("/create/")[-1]
-        print(f"\n→ Submitting: {req_name}")
-
-        try:
-            result = create_request(
-                instance_key=INSTANCE_KEY,
-                service_desk_id=service_desk_id,
-                request_type_id=request_type_id,
-                request_type_name=req_name,
-            )
-
-            data = result["body"]
-
-            print(f"   ✔ HTTP Code : {result['status_code']}")
-            print(f"   ✔ Issue Key : {data['issueKey']}")
-            print(f"   ✔ Summary   : {data['summary']}")
-            print(f"   ✔ Status    : {data['currentStatus']['status']}")
-            print(f"   ✔ Link      : {data['_links']['web']}")
-
-        except Exception as e:
-            print(f"   ✖ FAILED : {req_name}")
-            print(f"     Reason : {e}")
-            failures.append({"request": req_name, "error": str(e)})
-
-    page.close()
-
-    if failures:
-        print("\n========== FAILURES SUMMARY ==========")
-        for f in failures:
-            print(f"{f['request']} → {f['error']}")
-        pytest.fail(f"{len(failures)} request submissions failed")
-
-
-
-
-
-
-
-
-
-
-
-
+    if "error" in outcome:
+        pytest.fail(f"{req_name} → {outcome['error']}")
@@ -1,7 +1,9 @@
 import pytest
 from urllib.parse import urljoin
 from playwright.sync_api import BrowserContext
-from helpers.collect_request_type_links import collect_request_links
+from helpers.link_checker import LinkChecker
+from helpers.portal_inventory import PortalInventory
+from helpers.portal_snapshot import PortalSnapshot
 from config.config import CONFIG
 import os
 os.environ["NODE_TLS_REJECT_UNAUTHORIZED"] = "0"
@@ -17,15 +19,8 @@ logger = get_logger(
 # =====================================================
 # FETCH REQUEST LINKS
 # =====================================================
-def fetch_request_links(context: BrowserContext, instance_key: str) -> dict[str, str]:
-    cfg = CONFIG[instance_key]
-    base = cfg["base_url"]
-    portal = cfg["portal"]
-
-    page = context.new_page()
-    page.goto(base + portal, wait_until="domcontentloaded")
-    links = collect_request_links(page)
-    page.close()
+def fetch_request_links(portal_inventory: PortalInventory, instance_key: str) -> dict[str, str]:
+    links = portal_inventory.links(instance_key)
 
     assert links, f"No request links found for {instance_key}"
     return links
@@ -34,32 +29,69 @@ def fetch_request_links(context: BrowserContext, instance_key: str) -> dict[str,
 # =====================================================
 # PRINT LINK DETAILS
 # =====================================================
-def print_link_details(context: BrowserContext, instance_key: str, links: dict[str, str]):
+def print_link_details(
+    context: BrowserContext,
+    instance_key: str,
+    links: dict[str, str],
+    link_check: dict | None = None,
+    portal_snapshot: PortalSnapshot | None = None,
+):
     cfg = CONFIG[instance_key]
     base = cfg["base_url"]
 
-    page = context.new_page()
-    broken_links = []
+    # Forms the portal snapshot has already loaded reuse that navigation's
+    # status; the remaining links are requested over HTTP (no crawl).
+    loaded = portal_snapshot.loaded_facet(instance_key, "http_status") if portal_snapshot else {}
 
-    print(f"\n📋 {instance_key} LINK DETAILS:")
+    results = {}
+    unchecked = {}
     for name, href in links.items():
         url = urljoin(base, href)
-        try:
-            response = page.request.get(url, max_redirects=5, timeout=30000)
-            print(f"  - {name}")
-            print(f"      STATUS   : {response.status}")
-            print(f"      REDIRECT : {response.url}")
+        page_load = loaded.get(name)
+
+        if page_load and page_load["status"] is not None:
+            results[name] = {
+                "url": url,
+                "method": "PAGE",
+                "status": page_load["status"],
+                "final_url": page_load["final_url"],
+                "latency": page_load["latency"],
+                "error": None,
+            }
+        else:
+            unchecked[name] = url
+
+    if unchecked:
+        with LinkChecker(
+            context.cookies(),
+            verify=cfg.get("verify_ssl", True),
+            **(link_check or {}),
+        ) as checker:
+            results.update(checker.check_all(unchecked))
+
+    results = {name: results[name] for name in links}
 
-            if response.status >= 400:
-                broken_links.append((name, url, response.status))
+    broken_links = []
+
+    print(f"\n📋 {instance_key} LINK DETAILS:")
+    for name, result in results.items():
+        url = result["url"]
+        print(f"  - {name}")
 
-        except Exception as e:
-            print(f"  - {name}")
+        if result["error"]:
             print(f"      STATUS   : ERROR")
-            print(f"      REASON   : {e}")
+            print(f"      REASON   : {result['error']}")
+            print(f"      LATENCY  : {result['latency']:.2f}s")
             broken_links.append((name, url, "EXCEPTION"))
+            continue
+
+        print(f"      STATUS   : {result['status']} ({result['method']})")
+        print(f"      REDIRECT : {result['final_url']}")
+        print(f"      LATENCY  : {result['latency']:.2f}s")
+
+        if result["status"] >= 400:
+            broken_links.append((name, url, result["status"]))
 
-    page.close()
     return broken_links
 
 
@@ -67,16 +99,16 @@ def print_link_details(context: BrowserContext, instance_key: str, links: dict[s
 # =====================================================
 # POSITIVE TEST
 # =====================================================
-def test_compare_instance_links_positive(contexts):
+def test_compare_instance_links_positive(contexts, portal_inventory, portal_snapshot, link_check):
     left, right = list(CONFIG.keys())
 
-    left_links = fetch_request_links(contexts[left], left)
-    right_links = fetch_request_links(contexts[right], right)
+    left_links = fetch_request_links(portal_inventory, left)
+    right_links = fetch_request_links(portal_inventory, right)
 
     print("\n========== POSITIVE LINK COMPARISON ==========")
 
-    left_broken = print_link_details(contexts[left], left, left_links)
-    right_broken = print_link_details(contexts[right], right, right_links)
+    left_broken = print_link_details(contexts[left], left, left_links, link_check, portal_snapshot)
+    right_broken = print_link_details(contexts[right], right, right_links, link_check, portal_snapshot)
 
     print(f"\n{left} count  : {len(left_links)}")
     print(f"{right} count : {len(right_links)}")
@@ -97,11 +129,11 @@ def test_compare_instance_links_positive(contexts):
 # NEGATIVE TEST (INTENTIONAL FAILURE)
 # =====================================================
 @pytest.mark.xfail(strict=True, reason="link injected for negative testing")
-def test_compare_instance_links_negative(contexts):
+def test_compare_instance_links_negative(contexts, portal_inventory, portal_snapshot, link_check):
     left, right = list(CONFIG.keys())
 
-    left_links = fetch_request_links(contexts[left], left)
-    right_links = fetch_request_links(contexts[right], right)
+    left_links = fetch_request_links(portal_inventory, left)
+    right_links = fetch_request_links(portal_inventory, right)
 
     #Inject fake link
     right_links["FAKE_BROKEN_LINK"] = "/create/THIS_SHOULD_FAIL"
@@ -109,8 +141,8 @@ def test_compare_instance_links_negative(contexts):
     print("\n========== NEGATIVE LINK COMPARISON ==========")
 
     # PRINT LINKS FIRST
-    print_link_details(contexts[left], left, left_links)
-    print_link_details(contexts[right], right, right_links)
+    print_link_details(contexts[left], left, left_links, link_check, portal_snapshot)
+    print_link_details(contexts[right], right, right_links, link_check, portal_snapshot)
 
     # PRINT COUNTS
     print(f"\n{left} count  : {len(left_links)}")
@@ -0,0 +1,84 @@
+"""
+Offline parity of the two workflow transition sources: a workflows/search
+response (REST mode) and the "View as text" dialogs of the same workflows
+(UI mode). No browser or Jira instance is needed:
+
+  python -m pytest --noconftest tests
+"""
+import json
+import os
+
+from helpers.workflow_transitions import (
+    build_workflow_transitions,
+    parse_workflow_transitions,
+)
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+
+# /rest/api/3/screens lookup for the screen IDs in workflows_search.json
+SCREEN_NAMES = {
+    "10005": "JIRA Service Desk Resolve Issue Screen",
+    "10006": "Resolve Incident Form",
+}
+
+
+def load_rest_transitions() -> dict[str, set[tuple[str, str, str, str]]]:
+    with open(os.path.join(DATA_DIR, "workflows_search.json"), encoding="utf-8") as f:
+        data = json.load(f)
+
+    status_names = {s["statusReference"]: s["name"] for s in data["statuses"]}
+    return {
+        wf["name"]: build_workflow_transitions(wf, status_names, SCREEN_NAMES)
+        for wf in data["values"]
+    }
+
+
+def load_ui_transitions() -> dict[str, set[tuple[str, str, str, str]]]:
+    """
+    workflow_view_as_text.txt holds one dialog per workflow, separated by
+    a blank line and headed by the workflow name.
+    """
+    with open(os.path.join(DATA_DIR, "workflow_view_as_text.txt"), encoding="utf-8") as f:
+        dialogs = f.read().strip().split("\n\n")
+
+    transitions = {}
+    for dialog in dialogs:
+        name, text = dialog.split("\n", 1)
+        transitions[name] = parse_workflow_transitions(text)
+    return transitions
+
+
+def test_rest_matches_view_as_text():
+    workflow = "SUP: Service Request Fulfilment workflow"
+
+    assert load_rest_transitions()[workflow] == load_ui_transitions()[workflow]
+
+
+def test_rest_expands_global_and_skips_initial_transitions():
+    transitions = load_rest_transitions()["SUP: Service Request Fulfilment workflow"]
+
+    assert {t for t in transitions if t[1] == "Cancel request"} == {
+        (status, "Cancel request", "No Screen", "Canceled")
+        for status in ("Waiting for support", "In Progress", "Resolved", "Canceled")
+    }
+    assert not any(t[1] == "Create" for t in transitions)
+
+
+def test_screen_without_screen_in_its_name_differs():
+    """
+    Known difference: the text parser only recognises screen lines by
+    "Screen" in their name, so "Resolve Incident Form" is read as the
+    transition and "Resolve" as a status. REST reports the real names;
+    both modes compare each instance with the same source, so the check
+    itself is unaffected.
+    """
+    workflow = "SUP: Incident workflow"
+    rest = load_rest_transitions()[workflow]
+    ui = load_ui_transitions()[workflow]
+
+    assert rest - ui == {
+        ("Waiting for support", "Resolve", "Resolve Incident Form", "Resolved"),
+    }
+    assert ui - rest == {
+        ("Resolve", "Resolve Incident Form", "No Screen", "Resolved"),
+    }